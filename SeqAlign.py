@@ -1,6 +1,98 @@
+import os
+import ctypes
+import platform
+from array import array
 from typing import Tuple, List, Dict, Optional
 import numpy as np
 
+try:
+    from numba import njit, prange, config as _numba_config
+    _NUMBA_AVAILABLE = True
+    _NUMBA_THREADS = _numba_config.NUMBA_NUM_THREADS
+except ImportError:
+    prange = range
+    _NUMBA_AVAILABLE = False
+    _NUMBA_THREADS = 1
+
+try:
+    from numba import cuda
+    _CUDA_AVAILABLE = cuda.is_available()
+except ImportError:
+    _CUDA_AVAILABLE = False
+
+try:
+    from seqalign_kernels import fill_nw_int16, fill_sw_int16
+    _CYTHON_AVAILABLE = True
+except ImportError:
+    _CYTHON_AVAILABLE = False
+
+# Striped Smith-Waterman variants in _sw_striped.so, fastest first, as (BIOHUB_ISA name, CPU probe, kernel)
+_SW_ISAS = (('avx512', 'biohub_has_avx512bw', 'sw_striped_avx512'),
+            ('avx2', 'biohub_has_avx2', 'sw_striped_avx2'),
+            ('sse41', 'biohub_has_sse41', 'sw_striped_sse41'))
+
+def _load_striped_kernel() -> Tuple[Optional[ctypes._CFuncPtr], Optional[str]]:
+    """
+    Load the widest striped Smith-Waterman kernel the CPU supports from _sw_striped.so, if it is built.
+
+    Setting the BIOHUB_ISA environment variable to 'avx512', 'avx2' or 'sse41' forces that variant,
+    e.g. for benchmarking, and 'none' disables the striped kernels. If the forced variant is not
+    supported by the CPU, the Numba and Python kernels are used instead.
+
+    Returns:
+        Tuple[Optional[ctypes._CFuncPtr], Optional[str]]: The kernel and the name of its instruction
+        set, or (None, None) if no variant can be used.
+    """
+    isa = os.environ.get('BIOHUB_ISA', '').lower()
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_sw_striped.so')
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None, None
+
+    for name, probe, symbol in _SW_ISAS:
+        if isa and isa != name:
+            continue
+        if not getattr(lib, probe)():
+            continue
+        kernel = getattr(lib, symbol)
+        kernel.restype = ctypes.c_int
+        kernel.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int,
+                           ctypes.c_void_p, ctypes.c_int, ctypes.c_int16]
+        return kernel, name
+    return None, None
+
+_sw_striped_kernel, _SW_ISA = _load_striped_kernel()
+
+# PyPy's JIT compiles scalar loops over lists and array.array well but cannot see through NumPy
+# element access, so under PyPy the score matrix is always filled in a flat array.array buffer.
+# On CPython the NumPy/Numba kernels are used; for small sequences their per-call dispatch dominates.
+_IS_PYPY = platform.python_implementation() == 'PyPy'
+
+# Below this sequence length the per-antidiagonal NumPy call overhead outweighs the vectorization
+# gain, and the scalar array.array loop is used instead.
+_WAVEFRONT_MIN_LEN = 64
+
+# Side of the square blocks used by the tiled fill: two 32 x 32 int32 blocks take 8 KB, well within
+# L1. Score matrices with at least _TILED_MIN_CELLS cells (16 MB as int32) are filled block by block
+# when Numba has more than one thread; on a single thread the row-by-row kernel is as fast, since the
+# fill is bound by the dependency between neighbouring cells rather than by memory.
+_TILE = 32
+_TILED_MIN_CELLS = 1 << 22
+
+# align() fills the score matrix on the GPU once the longer sequence exceeds _CUDA_MIN_LEN and the
+# shorter one has at least _CUDA_MIN_WIDTH bases; below that the kernel launches and transfers cost
+# more than the CPU fill. The fill takes one launch per antidiagonal, and an antidiagonal holds at most
+# min(M, N) cells, so a skinny matrix (e.g. 20000 x 10) would pay ~M + N launches for a few cells each.
+# _CUDA_THREADS is the block size.
+_CUDA_MIN_LEN = 10000
+_CUDA_MIN_WIDTH = 2048
+_CUDA_THREADS = 256
+
+# _fill_directions works on blocks of rows of about _DIRECTION_BLOCK_CELLS cells, so its int32
+# temporaries stay a few MB however large the matrix is.
+_DIRECTION_BLOCK_CELLS = 1 << 18
+
 def create_substitution_matrix() -> Dict[Tuple[str, str], int]:
     """
     Create a substitution matrix for DNA sequence alignment.
@@ -35,12 +127,465 @@ def find_max_local(matrix: np.ndarray) -> Tuple[int, int, int]:
             - i (int): The row index of the maximum value.
             - j (int): The column index of the maximum value.
     """
-    score = np.max(matrix)
-    i, j = np.unravel_index(np.argmax(matrix), matrix.shape)
-    return score, i, j
+    # argmax already visits every cell, so read the maximum back from its index instead of a second np.max pass
+    idx = int(matrix.argmax())
+    i, j = divmod(idx, matrix.shape[1])
+    return int(matrix.flat[idx]), i, j
+
+def create_substitution_array(alphabet: str = 'ACGT') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Create a dense substitution matrix for DNA sequence alignment.
+
+    This is the array form of `create_substitution_matrix`: the same scores are stored in a small
+    2D array indexed by integer-encoded bases instead of a dictionary keyed by base pairs.
+
+    Args:
+        alphabet (str, optional): The bases covered by the matrix (default is 'ACGT').
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: A tuple containing:
+            - enc_table (np.ndarray): A uint8 array of length 256 mapping the ASCII code of each base to its
+              row/column in `sub`. Characters outside the alphabet map to 255.
+            - sub (np.ndarray): An int16 array of shape (len(alphabet), len(alphabet)) with the scores.
+    """
+    complementary = {('A', 'T'), ('T', 'A'), ('G', 'C'), ('C', 'G')}
+    sub = np.array([[5 if b1 == b2 else -4 if (b1, b2) in complementary else -3 for b2 in alphabet]
+                    for b1 in alphabet], dtype=np.int16)
+    return _encoding_table(alphabet), sub
+
+def substitution_array_from_matrix(matrix) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a dictionary or Biopython substitution matrix into the dense form used by the aligner.
+
+    Args:
+        matrix: A dictionary with base pair tuples as keys and scores as values, or a
+                `Bio.Align.substitution_matrices` matrix.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The 256-entry encoding table and the dense substitution array,
+        as returned by `create_substitution_array`.
+    """
+    if hasattr(matrix, 'alphabet'):
+        alphabet = ''.join(matrix.alphabet)
+    else:
+        alphabet = ''.join(sorted({base for pair in matrix for base in pair}))
+    sub = np.array([[matrix[(c1, c2)] for c2 in alphabet] for c1 in alphabet], dtype=np.int32)
+    return _encoding_table(alphabet), sub
+
+def _encoding_table(alphabet: str) -> np.ndarray:
+    """
+    Build a 256-entry lookup table mapping each character of `alphabet` to its index.
+
+    Lowercase letters share the index of their uppercase form unless the alphabet lists them itself,
+    so mixed-case sequences are encoded without an upper() copy.
+    """
+    enc = np.full(256, 255, dtype=np.uint8)
+    for index, c in enumerate(alphabet):
+        if c.lower() not in alphabet:
+            enc[ord(c.lower())] = index
+    enc[[ord(c) for c in alphabet]] = np.arange(len(alphabet))
+    return enc
+
+# Encoding table for plain DNA, shared by every match/mismatch alignment of A/C/G/T sequences
+_ENC = _encoding_table('ACGT')
+
+def _encode_sequences(A: str, B: str, match_score: int, mismatch_score: int,
+                      subM=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Encode two sequences as small-integer arrays together with a dense substitution table.
+
+    Every character of the scoring alphabet is assigned an index through a 256-entry lookup table,
+    so that the score of aligning A[i] with B[j] becomes a plain array access `sub[a[i], b[j]]`.
+
+    Args:
+        A (str): The first sequence.
+        B (str): The second sequence.
+        match_score (int): The score for a matching pair of bases, used when `subM` is None.
+        mismatch_score (int): The score for a mismatching pair of bases, used when `subM` is None.
+        subM (optional): A substitution matrix as a dictionary, a Biopython substitution matrix or
+                         an `(enc_table, sub)` tuple as returned by `create_substitution_array`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The encoded sequences `a`, `b` (uint8) and the
+        int32 substitution table `sub`.
+
+    Raises:
+        KeyError: If a sequence contains a character that is not covered by the substitution matrix.
+    """
+    enc, sub = _scoring_arrays(match_score, mismatch_score, subM, (A, B))
+    return _encode(A, enc), _encode(B, enc), sub
+
+def _scoring_arrays(match_score: int, mismatch_score: int, subM, sequences) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the encoding table and int32 substitution array for `subM`, or for match/mismatch scoring
+    over the characters of `sequences` when `subM` is None."""
+    if subM is None:
+        alphabet = ''.join(sorted(set(''.join(set().union(*sequences)).upper())))
+        if set(alphabet) <= set('ACGT'):
+            alphabet, enc = 'ACGT', _ENC
+        else:
+            enc = _encoding_table(alphabet)
+        sub = np.full((len(alphabet), len(alphabet)), mismatch_score, dtype=np.int32)
+        np.fill_diagonal(sub, match_score)
+    elif isinstance(subM, tuple):
+        enc, sub = subM
+    else:
+        enc, sub = substitution_array_from_matrix(subM)
+    return enc, np.ascontiguousarray(sub, dtype=np.int32)
+
+def _encode(seq: str, enc: np.ndarray) -> np.ndarray:
+    """Encode `seq` through the lookup table `enc`, raising KeyError on characters it does not cover."""
+    codes = enc[np.frombuffer(seq.encode('ascii'), dtype=np.uint8)]
+    if (codes == 255).any():
+        raise KeyError(seq[int(np.argmax(codes == 255))])
+    return codes
+
+def _fits_dtype(M: int, N: int, sub: np.ndarray, gap: int, dtype=np.int16) -> bool:
+    """Check that no cell of an M x N score matrix can leave the range of the integer `dtype`."""
+    bound = max(int(np.abs(sub).max(initial=0)), abs(gap))
+    return (M + N) * bound <= np.iinfo(dtype).max
+
+def fill_sw_striped(a: np.ndarray, b: np.ndarray, sub: np.ndarray, gap: int) -> Optional[int]:
+    """
+    Compute the best local alignment score with the striped SIMD Smith-Waterman kernel (see `_SW_ISA`).
+
+    Args:
+        a (np.ndarray): The first sequence, encoded as row indices of `sub`.
+        b (np.ndarray): The second sequence, encoded as column indices of `sub`.
+        sub (np.ndarray): The dense substitution matrix.
+        gap (int): The (negative) gap penalty.
+
+    Returns:
+        Optional[int]: The best local alignment score, or None if the kernel is unavailable, or the
+        gap, the substitution scores or the best score do not fit in 16 bits.
+    """
+    # The kernel takes the gap as int16 and keeps its scores in 16 bits, so both must stay well inside that range
+    if (_sw_striped_kernel is None or gap >= 0 or gap < np.iinfo(np.int16).min // 2
+            or np.abs(sub).max(initial=0) > np.iinfo(np.int16).max // 2):
+        return None
+    a = np.ascontiguousarray(a, dtype=np.uint8)
+    b = np.ascontiguousarray(b, dtype=np.uint8)
+    sub = np.ascontiguousarray(sub, dtype=np.int16)
+    score = _sw_striped_kernel(a.ctypes.data, len(a), b.ctypes.data, len(b), sub.ctypes.data, sub.shape[0], gap)
+    return score if score >= 0 else None
+
+def _new_score_matrix(M: int, N: int, gap: int, local: bool, dtype) -> np.ndarray:
+    """Allocate an M x N score matrix of `dtype` with the boundary row and column initialized."""
+    scoreM = np.zeros((M, N), dtype=dtype)
+    if not local:
+        scoreM[0] = np.arange(N) * gap
+        scoreM[:, 0] = np.arange(M) * gap
+    return scoreM
+
+# Traceback directions stored in the direction matrix. Ties are broken in this order, diagonal first.
+DIR_DIAG, DIR_UP, DIR_LEFT, DIR_STOP = 0, 1, 2, 3
+
+# ASCII code of the gap character written by the traceback
+_GAP = ord('-')
+
+def _new_direction_matrix(M: int, N: int, local: bool) -> np.ndarray:
+    """Allocate an M x N int8 direction matrix with the boundary row and column initialized."""
+    dirM = np.empty((M, N), dtype=np.int8)
+    if local:
+        dirM[0] = DIR_STOP
+        dirM[:, 0] = DIR_STOP
+    else:
+        dirM[0] = DIR_LEFT
+        dirM[:, 0] = DIR_UP
+        dirM[0, 0] = DIR_STOP
+    return dirM
+
+def _dp_fill_global(a: np.ndarray, b: np.ndarray, sub: np.ndarray, gap: int, scoreM: np.ndarray,
+                    dirM: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fill the Needleman-Wunsch score matrix `scoreM` in place for the encoded sequences `a` and `b`.
+
+    If `dirM` is given, the direction each cell was reached from is recorded in it as well.
+    """
+    M, N = a.shape[0] + 1, b.shape[0] + 1
+    for i in range(1, M):
+        ai = a[i-1]
+        for j in range(1, N):
+            diag = scoreM[i-1, j-1] + sub[ai, b[j-1]]
+            up = scoreM[i-1, j] + gap
+            left = scoreM[i, j-1] + gap
+            best = max(diag, up, left)
+            scoreM[i, j] = best
+            if dirM is not None:
+                dirM[i, j] = DIR_DIAG if best == diag else (DIR_UP if best == up else DIR_LEFT)
+    return scoreM
+
+def _dp_fill_local(a: np.ndarray, b: np.ndarray, sub: np.ndarray, gap: int, scoreM: np.ndarray,
+                   dirM: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fill the Smith-Waterman score matrix `scoreM` in place for the encoded sequences `a` and `b`.
+
+    If `dirM` is given, the direction each cell was reached from is recorded in it as well.
+    """
+    M, N = a.shape[0] + 1, b.shape[0] + 1
+    for i in range(1, M):
+        ai = a[i-1]
+        for j in range(1, N):
+            diag = scoreM[i-1, j-1] + sub[ai, b[j-1]]
+            up = scoreM[i-1, j] + gap
+            left = scoreM[i, j-1] + gap
+            # Clamp after taking the maximum: a literal 0 among the max() arguments makes Numba
+            # unify the operand types per cell, which is ~2.5x slower
+            best = max(max(diag, up, left), 0)
+            scoreM[i, j] = best
+            if dirM is not None:
+                if best == 0:
+                    dirM[i, j] = DIR_STOP
+                else:
+                    dirM[i, j] = DIR_DIAG if best == diag else (DIR_UP if best == up else DIR_LEFT)
+    return scoreM
+
+def _fill_directions(a: np.ndarray, b: np.ndarray, sub: np.ndarray, gap: int, local: bool,
+                     scoreM: np.ndarray, dirM: np.ndarray) -> np.ndarray:
+    """
+    Derive the interior of the direction matrix `dirM` from a filled score matrix with vectorized passes.
+
+    Used for the kernels that do not record directions themselves. Rows are processed in blocks, and
+    the directions are selected as int8, so the temporaries stay bounded by _DIRECTION_BLOCK_CELLS.
+    """
+    M, N = scoreM.shape
+    rows = max(1, _DIRECTION_BLOCK_CELLS // N)
+    for start in range(1, M, rows):
+        stop = min(start + rows, M)
+        scores = scoreM[start - 1:stop].astype(np.int32)
+        H = scores[1:, 1:]
+        diag = scores[:-1, :-1] + sub[a[start - 1:stop - 1, None], b]
+        up = scores[:-1, 1:] + gap
+        inner = dirM[start:stop, 1:]
+        inner[...] = np.where(H == diag, np.int8(DIR_DIAG),
+                              np.where(H == up, np.int8(DIR_UP), np.int8(DIR_LEFT)))
+        if local:
+            inner[H == 0] = DIR_STOP
+    return dirM
+
+def _dp_fill_wavefront(a: np.ndarray, b: np.ndarray, sub: np.ndarray, gap: int, local: bool,
+                       scoreM: np.ndarray) -> np.ndarray:
+    """
+    Fill the score matrix `scoreM` in place one antidiagonal at a time with vectorized NumPy operations.
+
+    Cells on the same antidiagonal (i + j == k) only depend on the two previous antidiagonals, so each
+    antidiagonal is computed by a handful of ufunc calls instead of a Python loop over its cells. In the
+    flattened matrix an antidiagonal is a strided slice with step N - 1, and its up, left and diagonal
+    neighbours are the same slice shifted by -N, -1 and -N - 1.
+    """
+    M, N = a.shape[0] + 1, b.shape[0] + 1
+    if M == 1 or N == 1:
+        return scoreM
+
+    flat = scoreM.ravel()
+    b_rev = b[::-1]
+    step = N - 1
+    for k in range(2, M + N - 1):
+        i_lo, i_hi = max(1, k - N + 1), min(k - 1, M - 1)
+        start = i_lo * N + (k - i_lo)
+        stop = i_hi * N + (k - i_hi) + 1
+        s = sub[a[i_lo-1:i_hi], b_rev[N-1-k+i_lo:N-k+i_hi]]
+
+        best = flat[start-N-1:stop-N-1:step] + s
+        np.maximum(best, flat[start-N:stop-N:step] + gap, out=best)
+        np.maximum(best, flat[start-1:stop-1:step] + gap, out=best)
+        if local:
+            np.maximum(best, 0, out=best)
+        flat[start:stop:step] = best
+    return scoreM
+
+def _dp_fill_tiled(a: np.ndarray, b: np.ndarray, sub: np.ndarray, gap: int, local: bool,
+                   scoreM: np.ndarray) -> np.ndarray:
+    """
+    Fill the score matrix `scoreM` in place in _TILE x _TILE blocks, visiting the blocks along antidiagonals.
+
+    Each block is computed in a small scratch array seeded with its top row and left column from the
+    score matrix, so the inner loops only touch data that stays in L1; the finished block is then
+    copied back. Blocks on one antidiagonal only depend on blocks of earlier antidiagonals, so they
+    are distributed over the Numba threads.
+    """
+    M, N = a.shape[0] + 1, b.shape[0] + 1
+    T = _TILE
+    n_bi = (M - 1 + T - 1) // T
+    n_bj = (N - 1 + T - 1) // T
+    for d in range(n_bi + n_bj - 1):
+        bi_lo = max(0, d - n_bj + 1)
+        for k in prange(min(d, n_bi - 1) + 1 - bi_lo):
+            bi = bi_lo + k
+            bj = d - bi
+            tile = np.empty((T + 1, T + 1), dtype=scoreM.dtype)
+            i0, j0 = bi * T, bj * T
+            h, w = min(T, M - 1 - i0), min(T, N - 1 - j0)
+            for j in range(w + 1):
+                tile[0, j] = scoreM[i0, j0 + j]
+            for i in range(1, h + 1):
+                tile[i, 0] = scoreM[i0 + i, j0]
+
+            for i in range(1, h + 1):
+                ai = a[i0 + i - 1]
+                for j in range(1, w + 1):
+                    diag = tile[i-1, j-1] + sub[ai, b[j0 + j - 1]]
+                    up = tile[i-1, j] + gap
+                    left = tile[i, j-1] + gap
+                    best = max(diag, up, left)
+                    tile[i, j] = max(best, 0) if local else best
+
+            for i in range(1, h + 1):
+                for j in range(1, w + 1):
+                    scoreM[i0 + i, j0 + j] = tile[i, j]
+    return scoreM
+
+def _dp_score(a: np.ndarray, b: np.ndarray, sub: np.ndarray, gap: int, local: bool) -> int:
+    """
+    Compute only the optimal alignment score, keeping two rows of the score matrix instead of all of it.
+
+    For local alignment the best cell is tracked while the rows are filled, so no pass over a full
+    matrix is needed afterwards.
+    """
+    M, N = a.shape[0] + 1, b.shape[0] + 1
+    prev = np.zeros(N, dtype=np.int32)
+    curr = np.zeros(N, dtype=np.int32)
+    if not local:
+        for j in range(N):
+            prev[j] = j * gap
+
+    best = 0
+    for i in range(1, M):
+        curr[0] = 0 if local else i * gap
+        ai = a[i-1]
+        for j in range(1, N):
+            diag = prev[j-1] + sub[ai, b[j-1]]
+            up = prev[j] + gap
+            left = curr[j-1] + gap
+            h = max(diag, up, left)
+            if local:
+                h = max(h, 0)
+                best = max(best, h)
+            curr[j] = h
+        prev, curr = curr, prev
+    return best if local else prev[N-1]
+
+def _batch_fill(a_batch: np.ndarray, b_batch: np.ndarray, a_len: np.ndarray, b_len: np.ndarray,
+                sub: np.ndarray, gap: int, local: bool) -> np.ndarray:
+    """
+    Score a batch of independent alignments at once, one alignment per lane.
+
+    `a_batch` and `b_batch` are (max_len, lanes) arrays of padded, encoded sequences, so the innermost
+    loop runs over lanes on contiguous memory and every lane advances its own DP matrix in lockstep.
+    Only two rows of each matrix are kept. Padding cells come after the real cells of a lane and are
+    excluded when reading scores, so they never affect the result.
+    """
+    M, L = a_batch.shape
+    N = b_batch.shape[0]
+    prev = np.zeros((N + 1, L), dtype=np.int32)
+    curr = np.zeros((N + 1, L), dtype=np.int32)
+    scores = np.zeros(L, dtype=np.int32)
+    if not local:
+        for j in range(N + 1):
+            for l in range(L):
+                prev[j, l] = j * gap
+        for l in range(L):
+            if a_len[l] == 0:
+                scores[l] = b_len[l] * gap
+
+    for i in range(1, M + 1):
+        for l in range(L):
+            curr[0, l] = 0 if local else i * gap
+        for j in range(1, N + 1):
+            for l in range(L):
+                diag = prev[j-1, l] + sub[a_batch[i-1, l], b_batch[j-1, l]]
+                up = prev[j, l] + gap
+                left = curr[j-1, l] + gap
+                best = max(diag, up, left)
+                if local:
+                    best = max(best, 0)
+                    if best > scores[l] and i <= a_len[l] and j <= b_len[l]:
+                        scores[l] = best
+                curr[j, l] = best
+        if not local:
+            for l in range(L):
+                if a_len[l] == i:
+                    scores[l] = curr[b_len[l], l]
+        prev, curr = curr, prev
+    return scores
+
+def _traceback(dirM: np.ndarray, A: np.ndarray, B: np.ndarray, m: int, n: int,
+               outA: np.ndarray, outB: np.ndarray) -> int:
+    """
+    Follow the direction matrix from cell (m, n) and write the aligned characters into `outA` and `outB`.
+
+    `A` and `B` hold the sequences as ASCII codes. The alignment is written backwards from the end of the
+    output buffers, which must hold at least m + n characters; the index of its first column is returned.
+    """
+    k = len(outA)
+    # Leading gaps of a global alignment are part of the boundary row and column, so the
+    # walk only ends at the origin (global) or at a zero cell (local)
+    while True:
+        direction = dirM[m, n]
+        if direction == DIR_STOP:
+            break
+        k -= 1
+        if direction == DIR_DIAG:
+            outA[k] = A[m-1]
+            outB[k] = B[n-1]
+            m -= 1
+            n -= 1
+        elif direction == DIR_UP:
+            outA[k] = A[m-1]
+            outB[k] = _GAP
+            m -= 1
+        else:
+            outA[k] = _GAP
+            outB[k] = B[n-1]
+            n -= 1
+    return k
+
+if _NUMBA_AVAILABLE:
+    # The kernels only index with validated encodings, so bounds checks are dropped. Numba lowers
+    # max() over integers to compare-and-select instructions, so the cell update is already branch-free.
+    _dp_fill_global = njit(cache=True, boundscheck=False, fastmath=True)(_dp_fill_global)
+    _dp_fill_local = njit(cache=True, boundscheck=False, fastmath=True)(_dp_fill_local)
+    _dp_fill_tiled = njit(cache=True, boundscheck=False, fastmath=True, parallel=True)(_dp_fill_tiled)
+    _dp_score = njit(cache=True, boundscheck=False, fastmath=True)(_dp_score)
+    _batch_fill = njit(cache=True, boundscheck=False, fastmath=True)(_batch_fill)
+    _traceback = njit(cache=True, boundscheck=False)(_traceback)
+
+    # Compile (or load from the on-disk cache) once at import so the first alignment is not
+    # charged for the JIT.
+    _warmup = np.zeros(1, dtype=np.uint8)
+    for _dtype in (np.int16, np.int32):
+        for _dirM in (None, np.zeros((2, 2), dtype=np.int8)):
+            _dp_fill_global(_warmup, _warmup, np.zeros((1, 1), dtype=np.int32), -1, np.zeros((2, 2), dtype=_dtype), _dirM)
+            _dp_fill_local(_warmup, _warmup, np.zeros((1, 1), dtype=np.int32), -1, np.zeros((2, 2), dtype=_dtype), _dirM)
+        for _local in (False, True):
+            _dp_fill_tiled(_warmup, _warmup, np.zeros((1, 1), dtype=np.int32), -1, _local,
+                           np.zeros((2, 2), dtype=_dtype))
+    for _local in (False, True):
+        _dp_score(_warmup, _warmup, np.zeros((1, 1), dtype=np.int32), -1, _local)
+        _batch_fill(_warmup.reshape(1, 1), _warmup.reshape(1, 1), np.ones(1, dtype=np.int64),
+                    np.ones(1, dtype=np.int64), np.zeros((1, 1), dtype=np.int32), -1, _local)
+    # backtracking() passes the sequences as read-only np.frombuffer views, a distinct Numba type
+    _seq = np.frombuffer(b'A', dtype=np.uint8)
+    _traceback(np.full((2, 2), DIR_STOP, dtype=np.int8), _seq, _seq, 1, 1, _warmup.copy(), _warmup.copy())
+    del _warmup, _seq, _dtype, _dirM, _local
+
+if _CUDA_AVAILABLE:
+    @cuda.jit
+    def _cuda_fill_antidiagonal(a, b, sub, gap, local, k, i_lo, count, scoreM):
+        """Compute the `count` cells of antidiagonal `k` (i + j == k) starting at row `i_lo`, one cell per thread."""
+        t = cuda.grid(1)
+        if t >= count:
+            return
+        i = i_lo + t
+        j = k - i
+        diag = scoreM[i-1, j-1] + sub[a[i-1], b[j-1]]
+        up = scoreM[i-1, j] + gap
+        left = scoreM[i, j-1] + gap
+        best = max(diag, up, left)
+        scoreM[i, j] = max(best, 0) if local else best
 
 def dynamic_programming(A: str, B: str, match_score: int=2, mismatch_score: int=-1, subM: Dict[Tuple[str, str], int]=None, 
-                        gap_score: int = -1, strategy: str = "global") -> np.ndarray:
+                        gap_score: int = -1, strategy: str = "global", return_matrix: bool = True,
+                        score_dtype=None, return_directions: bool = False) -> np.ndarray:
     """
     Perform global or local sequence alignment using dynamic programming.
 
@@ -55,43 +600,176 @@ def dynamic_programming(A: str, B: str, match_score: int=2, mismatch_score: int=
         match_score (int, optional): The score for a matching pair of bases (default is 2).
         mismatch_score (int, optional): The penalty score for a mismatching pair of bases (default is -1).
         subM (Dict[Tuple[str, str], int], optional): A substitution matrix as a dictionary with base pair tuples as keys 
-                                                     and their corresponding score as values (default is None, in which case 
-                                                     match/mismatch scoring is used).
+                                                     and their corresponding score as values, a Biopython substitution matrix, 
+                                                     or the dense `(enc_table, sub)` form returned by `create_substitution_array` 
+                                                     (default is None, in which case match/mismatch scoring is used).
         gap_score (int, optional): The penalty score for introducing a gap in the alignment (default is -1).
         strategy (str, optional): The alignment strategy, either "global" for global alignment (Needleman-Wunsch) or 
                                   "local" for local alignment (Smith-Waterman) (default is "global").
+        return_matrix (bool, optional): If False, only the optimal alignment score is returned, which lets the
+                                        compiled path keep two rows of the matrix instead of all of it (default is True).
+        score_dtype (optional): The signed integer dtype of the score matrix. By default int16 is used whenever the scores
+                                are guaranteed to fit in it, halving memory traffic, and int32 otherwise.
+        return_directions (bool, optional): If True, an int8 direction matrix recording the move that produced
+                                            each cell (DIR_DIAG, DIR_UP, DIR_LEFT or DIR_STOP) is returned along
+                                            with the score matrix, for use by `backtracking` (default is False).
 
     Returns:
-        np.ndarray: A score matrix representing the alignment scores for the two sequences.
+        np.ndarray: A score matrix representing the alignment scores for the two sequences, or the optimal
+                    alignment score (int) if `return_matrix` is False. If `return_directions` is True, a
+                    tuple of the score matrix and the direction matrix is returned instead.
 
     Raises:
-        ValueError: If an unsupported strategy is provided.
+        ValueError: If an unsupported strategy is provided, if `score_dtype` is not a signed integer dtype, or if
+                    the scores may overflow it.
     """
-    M, N = len(A) + 1, len(B) + 1
-    scoreM = np.zeros((M, N), dtype=int)
-    
-    if strategy == "global":
-        scoreM[0] = np.arange(N) * gap_score
-        scoreM[:, 0] = np.arange(M) * gap_score
-    
+    a, b, sub = _encode_sequences(A, B, match_score, mismatch_score, subM)
+    local = strategy == "local"
+    if score_dtype is None:
+        score_dtype = np.int16 if _fits_dtype(len(A), len(B), sub, gap_score) else np.int32
+    elif not np.issubdtype(score_dtype, np.signedinteger):
+        raise ValueError(f"score_dtype must be a signed integer dtype, got {np.dtype(score_dtype)}.")
+    elif not _fits_dtype(len(A), len(B), sub, gap_score, score_dtype):
+        raise ValueError(f"Alignment scores may overflow {np.dtype(score_dtype)}, use a wider score_dtype.")
+
+    if not return_matrix and not return_directions and _NUMBA_AVAILABLE:
+        return int(_dp_score(a, b, sub, gap_score, local))
+
+    dirM = _new_direction_matrix(len(A) + 1, len(B) + 1, local) if return_directions else None
+    scoreM = _dp_fill(a, b, sub, gap_score, local, np.dtype(score_dtype), dirM)
+    if return_directions:
+        return scoreM, dirM
+    if not return_matrix:
+        return int(scoreM.max()) if local else int(scoreM[-1, -1])
+    return scoreM
+
+def dynamic_programming_cuda(A: str, B: str, match_score: int=2, mismatch_score: int=-1,
+                             subM: Dict[Tuple[str, str], int]=None, gap_score: int = -1,
+                             strategy: str = "global") -> np.ndarray:
+    """
+    Compute the score matrix of `dynamic_programming` on a CUDA GPU.
+
+    The matrix stays in device memory while it is filled one antidiagonal at a time: every cell of an
+    antidiagonal only depends on the two previous ones, so each antidiagonal is a single kernel launch
+    with one thread per cell, and launches on the same stream run in order. Only the finished matrix
+    is copied back to the host.
+
+    Args:
+        A (str): The first sequence to align.
+        B (str): The second sequence to align.
+        match_score (int, optional): The score for a matching pair of bases (default is 2).
+        mismatch_score (int, optional): The penalty score for a mismatching pair of bases (default is -1).
+        subM (optional): A substitution matrix, in any form accepted by `dynamic_programming` (default is None).
+        gap_score (int, optional): The penalty score for introducing a gap in the alignment (default is -1).
+        strategy (str, optional): The alignment strategy, either "global" or "local" (default is "global").
+
+    Returns:
+        np.ndarray: The score matrix, identical to the one returned by `dynamic_programming`.
+
+    Raises:
+        RuntimeError: If Numba cannot find a CUDA device.
+    """
+    if not _CUDA_AVAILABLE:
+        raise RuntimeError("No CUDA device is available.")
+
+    a, b, sub = _encode_sequences(A, B, match_score, mismatch_score, subM)
+    local = strategy == "local"
+    M, N = len(a) + 1, len(b) + 1
+    dtype = np.int16 if _fits_dtype(len(a), len(b), sub, gap_score) else np.int32
+
+    d_a, d_b, d_sub = cuda.to_device(a), cuda.to_device(b), cuda.to_device(sub)
+    d_scoreM = cuda.to_device(_new_score_matrix(M, N, gap_score, local, dtype))
+    for k in range(2, M + N - 1):
+        i_lo = max(1, k - N + 1)
+        count = min(k - 1, M - 1) - i_lo + 1
+        blocks = (count + _CUDA_THREADS - 1) // _CUDA_THREADS
+        _cuda_fill_antidiagonal[blocks, _CUDA_THREADS](d_a, d_b, d_sub, gap_score, local, k, i_lo, count, d_scoreM)
+    return d_scoreM.copy_to_host()
+
+def _dp_fill(a: np.ndarray, b: np.ndarray, sub: np.ndarray, gap: int, local: bool, dtype: np.dtype,
+             dirM: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fill a score matrix of `dtype` with the fastest kernel available for the encoded sequences.
+
+    If `dirM` is given it is filled with the traceback directions, by the kernel itself where it
+    records them and from the finished score matrix otherwise.
+    """
+    M, N = len(a) + 1, len(b) + 1
+    if _IS_PYPY:
+        return _dp_fill_flat(a, b, sub, gap, local, dirM).astype(dtype, copy=False)
+    if _CYTHON_AVAILABLE and dtype == np.int16:
+        scoreM = np.empty((M, N), dtype=np.int16)
+        fill = fill_sw_int16 if local else fill_nw_int16
+        fill(a, b, sub.astype(np.int16), gap, scoreM)
+    elif _NUMBA_AVAILABLE:
+        scoreM = _new_score_matrix(M, N, gap, local, dtype)
+        if not (_NUMBA_THREADS > 1 and M * N >= _TILED_MIN_CELLS):
+            fill = _dp_fill_local if local else _dp_fill_global
+            return fill(a, b, sub, gap, scoreM, dirM)
+        _dp_fill_tiled(a, b, sub, gap, local, scoreM)
+    elif min(len(a), len(b)) >= _WAVEFRONT_MIN_LEN:
+        scoreM = _new_score_matrix(M, N, gap, local, dtype)
+        _dp_fill_wavefront(a, b, sub, gap, local, scoreM)
+    else:
+        return _dp_fill_flat(a, b, sub, gap, local, dirM).astype(dtype, copy=False)
+
+    if dirM is not None:
+        _fill_directions(a, b, sub, gap, local, scoreM, dirM)
+    return scoreM
+
+def _dp_fill_flat(a: np.ndarray, b: np.ndarray, sub: np.ndarray, gap_score: int, local: bool,
+                  dirM: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fill the score matrix in a flat array.array buffer indexed as i * N + j with a scalar loop.
+
+    Used under PyPy and, without Numba, for short sequences on CPython: array.array stores and loads
+    C ints directly, which is about 2.5x faster than writing Python ints into NumPy cells.
+
+    The finished buffer is returned as a zero-copy int32 ndarray view. If `dirM` is given, its
+    interior is filled with the traceback directions.
+    """
+    a, b, sub = a.tolist(), b.tolist(), sub.tolist()
+    M, N = len(a) + 1, len(b) + 1
+    buf = array('i', [0]) * (M * N)
+    dirs = array('b', [DIR_STOP]) * (M * N) if dirM is not None else None
+    if not local:
+        for j in range(N):
+            buf[j] = j * gap_score
+        for i in range(M):
+            buf[i * N] = i * gap_score
+
     for i in range(1, M):
+        sub_row = sub[a[i-1]]
+        row, prev_row = i * N, (i - 1) * N
         for j in range(1, N):
-            score = subM[(A[i-1], B[j-1])] if subM is not None else (match_score if A[i-1] == B[j-1] else mismatch_score)
-            
-            if strategy == "local":
-                scoreM[i, j] = max(0, scoreM[i-1, j-1] + score, scoreM[i, j-1] + gap_score, scoreM[i-1, j] + gap_score)
-            else:
-                scoreM[i, j] = max(scoreM[i-1, j-1] + score, scoreM[i, j-1] + gap_score, scoreM[i-1, j] + gap_score)
-    
-    return scoreM
+            diag = buf[prev_row + j - 1] + sub_row[b[j-1]]
+            up = buf[prev_row + j] + gap_score
+            left = buf[row + j - 1] + gap_score
+            best = diag if diag >= up else up
+            best = best if best >= left else left
+            if local and best < 0:
+                best = 0
+            buf[row + j] = best
+
+            if dirs is not None:
+                if local and best == 0:
+                    dirs[row + j] = DIR_STOP
+                else:
+                    dirs[row + j] = DIR_DIAG if best == diag else (DIR_UP if best == up else DIR_LEFT)
+
+    if dirs is not None:
+        dirM[1:, 1:] = np.frombuffer(dirs, dtype=np.int8).reshape(M, N)[1:, 1:]
+    return np.frombuffer(buf, dtype=np.intc).reshape(M, N)
 
 def backtracking(A: str, B: str, scoreM: np.ndarray, match_score: int=2, mismatch_score: int=-1,
-        subM: Dict[Tuple[str, str], int]=None, gap_score: int = -1, strategy: str = "global") -> Tuple[str, str, int]:
+        subM: Dict[Tuple[str, str], int]=None, gap_score: int = -1, strategy: str = "global",
+        dirM: np.ndarray = None) -> Tuple[str, str, int]:
     """
     Perform backtracking to recover the optimal sequence alignment based on the score matrix.
 
     This function traces back through the score matrix generated from a dynamic programming algorithm to 
-    construct the aligned sequences. It supports both global and local alignment strategies.
+    construct the aligned sequences. It supports both global and local alignment strategies. The path is
+    read from the direction matrix, so no scores are recomputed during the traceback.
 
     Args:
         A (str): The first sequence to align.
@@ -100,11 +778,14 @@ def backtracking(A: str, B: str, scoreM: np.ndarray, match_score: int=2, mismatc
         match_score (int, optional): The score for a matching pair of bases (default is 2).
         mismatch_score (int, optional): The penalty score for a mismatching pair of bases (default is -1).
         subM (Dict[Tuple[str, str], int], optional): A substitution matrix as a dictionary with base pair tuples as keys 
-                                                     and their corresponding score as values (default is None, in which case 
-                                                     match/mismatch scoring is used).
+                                                     and their corresponding score as values, a Biopython substitution matrix, 
+                                                     or the dense `(enc_table, sub)` form returned by `create_substitution_array` 
+                                                     (default is None, in which case match/mismatch scoring is used).
         gap_score (int, optional): The penalty score for introducing a gap in the alignment (default is -1).
         strategy (str, optional): The alignment strategy, either "global" for global alignment (Needleman-Wunsch) or 
                                   "local" for local alignment (Smith-Waterman) (default is "global").
+        dirM (np.ndarray, optional): The direction matrix returned by `dynamic_programming` with
+                                     `return_directions=True`. If None, it is derived from `scoreM`.
 
     Returns:
         Tuple[str, str, int]: A tuple containing:
@@ -115,42 +796,29 @@ def backtracking(A: str, B: str, scoreM: np.ndarray, match_score: int=2, mismatc
     Raises:
         ValueError: If an unsupported alignment strategy is provided.
     """
-    alignmentA, alignmentB = [], []
     m, n = len(A), len(B)
+    local = strategy == "local"
+    if dirM is None:
+        a, b, sub = _encode_sequences(A, B, match_score, mismatch_score, subM)
+        dirM = _fill_directions(a, b, sub, gap_score, local, scoreM, _new_direction_matrix(m + 1, n + 1, local))
     
-    if strategy == "local":
+    if local:
         align_score, m, n = find_max_local(scoreM)
     else:
-        align_score = scoreM[m, n]
+        align_score = int(scoreM[m, n])
     
-    while m > 0 and n > 0:
-        score = scoreM[m, n]
-        if strategy == "local" and score == 0:
-            break
-        
-        sub_score = subM[(A[m-1], B[n-1])] if subM is not None else (match_score if A[m-1] == B[n-1] else mismatch_score)
-        
-        if score == scoreM[m-1, n-1] + sub_score:
-            alignmentA.append(A[m-1])
-            alignmentB.append(B[n-1])
-            m -= 1
-            n -= 1
-        elif score == scoreM[m-1, n] + gap_score:
-            alignmentA.append(A[m-1])
-            alignmentB.append('-')
-            m -= 1
-        else:
-            alignmentA.append('-')
-            alignmentB.append(B[n-1])
-            n -= 1
-    
-    if strategy == "global":
-        alignmentA.extend(A[m-1::-1])
-        alignmentB.extend('-' * m)
-        alignmentA.extend('-' * n)
-        alignmentB.extend(B[n-1::-1])
+    # The walk runs on ASCII codes and fills preallocated byte buffers, so no per-step
+    # Python strings are created; the compiled kernel takes arrays, the interpreter bytes
+    if _NUMBA_AVAILABLE:
+        seqA = np.frombuffer(A.encode('ascii'), dtype=np.uint8)
+        seqB = np.frombuffer(B.encode('ascii'), dtype=np.uint8)
+        outA, outB = np.empty(m + n, dtype=np.uint8), np.empty(m + n, dtype=np.uint8)
+    else:
+        seqA, seqB = A.encode('ascii'), B.encode('ascii')
+        outA, outB = bytearray(m + n), bytearray(m + n)
+    start = _traceback(dirM, seqA, seqB, m, n, outA, outB)
     
-    return (''.join(alignmentA[::-1]), ''.join(alignmentB[::-1]), align_score)
+    return (bytes(outA[start:]).decode('ascii'), bytes(outB[start:]).decode('ascii'), align_score)
 
 def align(seq1: str, seq2: str, match_score: int=2, mismatch_score: int=-1, substitution_matrix: Dict[Tuple[str, str], int]=None,
           gap_score: int = -1, strategy: str = "global") -> Tuple[Tuple[str, str, int], np.ndarray]:
@@ -159,7 +827,9 @@ def align(seq1: str, seq2: str, match_score: int=2, mismatch_score: int=-1, subs
 
     This function first computes the alignment score matrix using dynamic programming and then 
     uses backtracking to recover the optimal alignment. It supports both global (Needleman-Wunsch) 
-    and local (Smith-Waterman) alignment strategies.
+    and local (Smith-Waterman) alignment strategies. When a CUDA device is available, the score matrix
+    of long sequences (longer one above _CUDA_MIN_LEN, shorter one at least _CUDA_MIN_WIDTH) is
+    filled on the GPU.
 
     Args:
         seq1 (str): The first sequence to align.
@@ -178,12 +848,101 @@ def align(seq1: str, seq2: str, match_score: int=2, mismatch_score: int=-1, subs
             - alignment (Tuple[str, str, int]): The aligned sequences and the alignment score.
             - score_matrix (np.ndarray): The score matrix generated by the dynamic programming step.
     """
-    score_matrix = dynamic_programming(seq1, seq2, match_score=match_score, mismatch_score=mismatch_score,
-                                subM=substitution_matrix, gap_score=gap_score, strategy=strategy)
+    if (_CUDA_AVAILABLE and max(len(seq1), len(seq2)) > _CUDA_MIN_LEN
+            and min(len(seq1), len(seq2)) >= _CUDA_MIN_WIDTH):
+        # The directions are derived from the score matrix by backtracking
+        score_matrix = dynamic_programming_cuda(seq1, seq2, match_score=match_score, mismatch_score=mismatch_score,
+                                                subM=substitution_matrix, gap_score=gap_score, strategy=strategy)
+        direction_matrix = None
+    else:
+        score_matrix, direction_matrix = dynamic_programming(seq1, seq2, match_score=match_score, mismatch_score=mismatch_score,
+                                    subM=substitution_matrix, gap_score=gap_score, strategy=strategy,
+                                    return_directions=True)
     alignment = backtracking(seq1, seq2, score_matrix, match_score=match_score, mismatch_score=mismatch_score,
-                        subM=substitution_matrix, gap_score=gap_score, strategy=strategy)
+                        subM=substitution_matrix, gap_score=gap_score, strategy=strategy, dirM=direction_matrix)
     return (alignment, score_matrix)
 
+def alignment_score(seq1: str, seq2: str, match_score: int=2, mismatch_score: int=-1,
+                    substitution_matrix: Dict[Tuple[str, str], int]=None, gap_score: int = -1,
+                    strategy: str = "global") -> int:
+    """
+    Compute only the optimal alignment score of two sequences.
+
+    Local alignments are scored with the striped SIMD kernel when it is available; otherwise
+    `dynamic_programming` is asked for the score only, so the full matrix is not kept. No traceback
+    is performed.
+
+    Args:
+        seq1 (str): The first sequence to align.
+        seq2 (str): The second sequence to align.
+        match_score (int, optional): The score for matching characters in the sequences (default is 2).
+        mismatch_score (int, optional): The penalty score for mismatching characters (default is -1).
+        substitution_matrix (Dict[Tuple[str, str], int], optional): A substitution matrix, in any form accepted by
+                                                                   `dynamic_programming` (default is None).
+        gap_score (int, optional): The penalty for introducing a gap in the alignment (default is -1).
+        strategy (str, optional): The alignment strategy, either "global" or "local" (default is "global").
+
+    Returns:
+        int: The optimal alignment score.
+    """
+    if strategy == "local" and _sw_striped_kernel is not None:
+        a, b, sub = _encode_sequences(seq1, seq2, match_score, mismatch_score, substitution_matrix)
+        score = fill_sw_striped(a, b, sub, gap_score)
+        if score is not None:
+            return score
+
+    return dynamic_programming(seq1, seq2, match_score=match_score, mismatch_score=mismatch_score,
+                               subM=substitution_matrix, gap_score=gap_score, strategy=strategy, return_matrix=False)
+
+
+def batch_align(pairs: List[Tuple[str, str]], match_score: int=2, mismatch_score: int=-1,
+                substitution_matrix: Dict[Tuple[str, str], int]=None, gap_score: int = -1,
+                strategy: str = "global", lanes: int = 16) -> List[int]:
+    """
+    Compute the optimal alignment scores of many sequence pairs.
+
+    Pairs are sorted by length and grouped into batches of `lanes` similarly sized pairs, which are
+    padded and scored together so that each lane of the compiled kernel advances its own alignment.
+    Without Numba the pairs are scored one by one with `alignment_score`.
+
+    Args:
+        pairs (List[Tuple[str, str]]): The sequence pairs to align.
+        match_score (int, optional): The score for matching characters in the sequences (default is 2).
+        mismatch_score (int, optional): The penalty score for mismatching characters (default is -1).
+        substitution_matrix (Dict[Tuple[str, str], int], optional): A substitution matrix, in any form accepted by
+                                                                   `dynamic_programming` (default is None).
+        gap_score (int, optional): The penalty for introducing a gap in the alignment (default is -1).
+        strategy (str, optional): The alignment strategy, either "global" or "local" (default is "global").
+        lanes (int, optional): The number of alignments scored together in one batch (default is 16).
+
+    Returns:
+        List[int]: The alignment score of each pair, in the order of `pairs`.
+    """
+    if not _NUMBA_AVAILABLE:
+        return [alignment_score(seq1, seq2, match_score=match_score, mismatch_score=mismatch_score,
+                                substitution_matrix=substitution_matrix, gap_score=gap_score, strategy=strategy)
+                for seq1, seq2 in pairs]
+
+    enc, sub = _scoring_arrays(match_score, mismatch_score, substitution_matrix,
+                               [seq for pair in pairs for seq in pair])
+    order = sorted(range(len(pairs)), key=lambda k: (len(pairs[k][0]), len(pairs[k][1])))
+    scores = [0] * len(pairs)
+
+    for start in range(0, len(order), lanes):
+        batch = order[start:start + lanes]
+        a_len = np.array([len(pairs[k][0]) for k in batch], dtype=np.int64)
+        b_len = np.array([len(pairs[k][1]) for k in batch], dtype=np.int64)
+        a_batch = np.zeros((a_len.max(), len(batch)), dtype=np.uint8)
+        b_batch = np.zeros((b_len.max(), len(batch)), dtype=np.uint8)
+        for l, k in enumerate(batch):
+            a_batch[:a_len[l], l] = _encode(pairs[k][0], enc)
+            b_batch[:b_len[l], l] = _encode(pairs[k][1], enc)
+
+        batch_scores = _batch_fill(a_batch, b_batch, a_len, b_len, sub, gap_score, strategy == "local")
+        for l, k in enumerate(batch):
+            scores[k] = int(batch_scores[l])
+    return scores
+
 
 def print_score_matrix(s1: str, s2: str, mat: np.ndarray) -> None:
     """
@@ -1,135 +1,355 @@
 import os
 import re
+import ctypes
+import mmap
 import sys
+from typing import Iterator, NamedTuple, Tuple
 from utils import *
 from genetic_code import tables
+from translate import translate_bytes
 from itertools import product
 import numpy as np
 import seaborn as sns
 from matplotlib import pyplot as plt
 
-def read_fasta(filepath: str) -> dict:
-    """
-    Reads a FASTA file and returns a dictionary with headers as keys and sequences as values.
+try:
+    from _nb_stats import fast_stats, mismatches
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
 
-    Parameters:
-    filepath (str): The path to the FASTA file.
+def _load_simd_kernels():
+    """
+    Load the GC-count and Hamming kernels from _seq_simd.so, if it is built.
 
     Returns:
-    dict: A dictionary where the keys are headers and the values are sequences.
+    tuple: The gc_count and hamming ctypes functions for the widest instruction set the CPU
+    supports (AVX2, else SSE2), or (None, None) if the library is not available.
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_seq_simd.so')
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None, None
+
+    isa = 'avx2' if lib.biohub_simd_has_avx2() else 'sse2'
+    gc_count = getattr(lib, f'gc_count_{isa}')
+    gc_count.restype = ctypes.c_size_t
+    gc_count.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    hamming = getattr(lib, f'hamming_{isa}')
+    hamming.restype = ctypes.c_size_t
+    hamming.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+    return gc_count, hamming
+
+_simd_gc_count, _simd_hamming = _load_simd_kernels()
+
+# Bytes removed from FASTA sequence lines
+_SEQUENCE_WHITESPACE = b" \t\r\n\x0b\x0c"
+
+# 2-bit codes of A/C/G/T in either case, indexed by byte value; any other byte maps to 255
+_NUC_CODES = np.full(256, 255, dtype=np.uint8)
+for _code, _base in enumerate('ACGT'):
+    _NUC_CODES[ord(_base)] = _NUC_CODES[ord(_base.lower())] = _code
+del _code, _base
+
+# Keys of the count_* results, in product('ACGT') order, which is also the order of the packed 2-bit indices
+_DINUCLEOTIDES = [''.join(pair) for pair in product('ACGT', repeat=2)]
+_CODONS = [''.join(codon) for codon in product('ACGT', repeat=3)]
+
+class _ComplementTable(dict):
+    """str.translate table that maps the characters it does not list, i.e. non-ASCII ones, to N."""
+    def __missing__(self, key):
+        return 'N'
+
+# Complement of every symbol for str.translate / bytes.translate: A/C/G/T pair up in either case and
+# anything else becomes N
+_COMPLEMENT_BYTES = bytearray(b'N' * 256)
+for _base, _comp in zip(b'ACGTacgt', b'TGCAtgca'):
+    _COMPLEMENT_BYTES[_base] = _comp
+_COMPLEMENT_BYTES = bytes(_COMPLEMENT_BYTES)
+_COMPLEMENT_TABLE = _ComplementTable(str.maketrans({chr(i): chr(_COMPLEMENT_BYTES[i]) for i in range(128)}))
+del _base, _comp
+
+# Thymine to uracil in either case, for transcribe()
+_TRANSCRIBE_TABLE = str.maketrans('Tt', 'Uu')
+_TRANSCRIBE_BYTES = bytes.maketrans(b'Tt', b'Uu')
+
+# Accepted table IDs of translate()
+_VALID_TABLE_IDS = sorted(tables)
+
+# From this length on GC() counts over a NumPy byte view, which beats four str.count scans
+_GC_NUMPY_MIN_LEN = 2048
+
+# From this length on the single-pass Numba kernels in _nb_stats are used when Numba is installed
+_NUMBA_STATS_MIN_LEN = 1 << 16
+
+# Above this length GC() and hamming_distance() call the C kernels in _seq_simd.so when it is built
+_SIMD_MIN_LEN = 4096
+
+# Sequence inputs that are used as raw ASCII bytes without encoding
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+def _as_uint8(sequence) -> np.ndarray:
+    """
+    Return a uint8 view of the ASCII codes of a sequence.
 
-    Raises:
-    FileNotFoundError: If the file specified by filepath does not exist.
-    EmptyFileError: If the file is empty.
-    GeneralFASTAError: For any other errors encountered during file reading.
+    Bytes-like sequences are viewed without a copy; only str input is encoded, with any non-ASCII
+    character replaced by '?'.
+    """
+    if isinstance(sequence, _BYTES_LIKE):
+        return np.frombuffer(sequence, dtype=np.uint8)
+    return np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)
+
+class FastaStats(NamedTuple):
+    """Per record statistics yielded by read_fasta_with_stats."""
+    id: str
+    length: int
+    gc: float
+    A: int
+    C: int
+    G: int
+    T: int
+
+def _iter_fasta_blocks(filepath: str) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield the header and the raw sequence bytes, line breaks included, of each record of a FASTA file.
+
+    Raises the same errors as iter_fasta.
     """
-    records = {}
-    
     try:
-        # Check if the file is empty
-        if os.stat(filepath).st_size == 0:
-            raise EmptyFileError(filepath)
+        with open(filepath, mode="rb") as fasta_file:
+            # Check if the file is empty on the open descriptor; an empty file cannot be mapped
+            if os.fstat(fasta_file.fileno()).st_size == 0:
+                raise EmptyFileError(filepath)
+            fasta_reader = mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ)
         
-        with open(filepath, mode="r") as fasta_reader:
-            
-            header = None
-            sequence = []
-            
-            for line in fasta_reader:
-                line = line.strip()
-                if line.startswith(">"):
-                    # Save the previous header and sequence in the dictionary
-                    if header:
-                        records[header] = ''.join(sequence)
-                    # Update header and reset sequence
-                    header = line[1:].strip().split()[0]
-                    sequence = []
-                else:
-                    sequence.append(line)
-            
-            # Save the last header and sequence in the dictionary
-            if header:
-                records[header] = ''.join(sequence)
+        # The mapping stays valid after the file is closed and is unmapped when the generator finishes
+        with fasta_reader:
+            # Anything before the first header is ignored
+            if fasta_reader[:1] == b">":
+                start = 1
+            else:
+                start = fasta_reader.find(b"\n>")
+                if start == -1:
+                    return
+                start += 2
+
+            while start >= 0:
+                # Records are delimited by a '>' at the start of a line
+                end = fasta_reader.find(b"\n>", start)
+                block = fasta_reader[start:] if end == -1 else fasta_reader[start:end]
+                start = end if end == -1 else end + 2
+
+                header_line, _, body = block.partition(b"\n")
+                yield header_line.split()[0].decode(), body
                 
     except FileNotFoundError as e:
-        raise FileNotFoundError(filepath) from e
+        raise InputFileNotFoundError(filepath) from e
     except EmptyFileError as e:
         raise e
     except Exception as e:
         raise GeneralFASTAError(filepath, str(e)) from e
-    
-    # return the result as dictionary
-    return records
 
-def read_fastq(filepath: str) -> dict:
+def iter_fasta(filepath: str, as_bytes: bool = False) -> Iterator[Tuple[str, str]]:
     """
-    Reads a FASTQ file and returns a dictionary with headers as keys and sequences as values.
+    Lazily reads a FASTA file, yielding one (header, sequence) record at a time.
+
+    Only the record being yielded is held in memory, so arbitrarily large files can be scanned
+    with constant memory. Use read_fasta instead when random access by header is needed.
 
     Parameters:
-    filepath (str): The path to the FASTQ file.
+    filepath (str): The path to the FASTA file.
+    as_bytes (bool): If True, sequences are yielded as ASCII bytes instead of str, skipping the decode.
+    All analysis functions accept bytes sequences.
+
+    Yields:
+    tuple: The header and the sequence of each record, in file order.
+
+    Raises:
+    InputFileNotFoundError: If the file specified by filepath does not exist.
+    EmptyFileError: If the file is empty.
+    GeneralFASTAError: For any other errors encountered during file reading.
+    """
+    for header, body in _iter_fasta_blocks(filepath):
+        # Drop line breaks and padding from the sequence in a single C-level pass
+        sequence = body.translate(None, _SEQUENCE_WHITESPACE)
+        if as_bytes:
+            yield header, sequence
+            continue
+        try:
+            yield header, sequence.decode()
+        except UnicodeDecodeError as e:
+            raise GeneralFASTAError(filepath, str(e)) from e
+
+def read_fasta(filepath: str, as_bytes: bool = False) -> dict:
+    """
+    Reads a FASTA file and returns a dictionary with headers as keys and sequences as values.
+
+    The whole file is kept in memory; use iter_fasta to stream large files record by record.
+
+    Parameters:
+    filepath (str): The path to the FASTA file.
+    as_bytes (bool): If True, the sequences are ASCII bytes instead of str.
 
     Returns:
     dict: A dictionary where the keys are headers and the values are sequences.
 
     Raises:
-    FileNotFoundError: If the file specified by filepath does not exist.
+    InputFileNotFoundError: If the file specified by filepath does not exist.
     EmptyFileError: If the file is empty.
     GeneralFASTAError: For any other errors encountered during file reading.
     """
-    records = {}
-    
+    return dict(iter_fasta(filepath, as_bytes))
+
+def read_fasta_with_stats(filepath: str) -> Iterator[FastaStats]:
+    """
+    Lazily reads a FASTA file, yielding the length, GC content and base counts of each record.
+
+    The statistics are computed on the raw bytes while parsing, so no sequence string is decoded and
+    the sequence is not read a second time by GC() or count_nucleotides().
+
+    Parameters:
+    filepath (str): The path to the FASTA file.
+
+    Yields:
+    FastaStats: The header, length, GC content percentage and the A, C, G and T counts (case-insensitive)
+    of each record, in file order.
+
+    Raises:
+    InputFileNotFoundError: If the file specified by filepath does not exist.
+    EmptyFileError: If the file is empty.
+    GeneralFASTAError: For any other errors encountered during file reading.
+    """
+    for header, body in _iter_fasta_blocks(filepath):
+        sequence = body.translate(None, _SEQUENCE_WHITESPACE)
+        # bytes.count runs a C scan per symbol; for records of typical size this beats building a histogram
+        a, c, g, t = (sequence.count(upper) + sequence.count(lower)
+                      for upper, lower in (b'Aa', b'Cc', b'Gg', b'Tt'))
+        length = len(sequence)
+        gc = round(((g + c) / length) * 100, 4) if length else 0.0
+        yield FastaStats(header, length, gc, a, c, g, t)
+
+def _iter_fastq_records(filepath: str) -> Iterator[Tuple[str, bytes, bytes]]:
+    """
+    Yield the header and the raw sequence and quality bytes of each record of a FASTQ file.
+
+    Raises the same errors as iter_fastq.
+    """
     try:
-        # Check if the file is empty
-        if os.stat(filepath).st_size == 0:
-            raise EmptyFileError(filepath)
+        with open(filepath, mode="rb") as fastq_file:
+            # Check if the file is empty on the open descriptor; an empty file cannot be mapped
+            if os.fstat(fastq_file.fileno()).st_size == 0:
+                raise EmptyFileError(filepath)
+            fastq_reader = mmap.mmap(fastq_file.fileno(), 0, access=mmap.ACCESS_READ)
         
-        with open(filepath, mode="r") as fastq_reader:
+        # The mapping stays valid after the file is closed and is unmapped when the generator finishes
+        with fastq_reader:
+            # mmap.readline scans the mapped pages in C and returns bytes, so the separator line
+            # is never decoded
+            readline = fastq_reader.readline
             while True:
-                header = fastq_reader.readline().strip()
-                sequence = fastq_reader.readline().strip()
-                plus = fastq_reader.readline().strip()
-                quality = fastq_reader.readline().strip()
+                header = readline().strip()
+                sequence = readline().strip()
+                plus = readline().strip()
+                quality = readline().strip()
 
                 # If any line is empty, we've reached the end of the file
                 if not header or not sequence or not plus or not quality:
                     break
 
-                if not header.startswith("@") or not plus.startswith("+"):
+                if not header.startswith(b"@") or not plus.startswith(b"+"):
                     raise GeneralFASTAError(filepath, "Invalid FASTQ format")
 
-                header = header[1:].split()[0]  # Remove '@' and get the header
-                
-                records[header] = sequence
+                header = header[1:].split()[0].decode()  # Remove '@' and get the header
+                yield header, sequence, quality
 
     except FileNotFoundError as e:
-        raise FileNotFoundError(filepath) from e
+        raise InputFileNotFoundError(filepath) from e
     except EmptyFileError as e:
         raise e
     except Exception as e:
         raise GeneralFASTAError(filepath, str(e)) from e
-    
-    return records
+
+def iter_fastq(filepath: str, as_bytes: bool = False) -> Iterator[Tuple[str, str, str]]:
+    """
+    Lazily reads a FASTQ file, yielding one (header, sequence, quality) record at a time.
+
+    Only the record being yielded is held in memory, so arbitrarily large files can be scanned
+    with constant memory. Use read_fastq instead when random access by header is needed.
+
+    Parameters:
+    filepath (str): The path to the FASTQ file.
+    as_bytes (bool): If True, sequences and quality strings are yielded as ASCII bytes instead of str.
+
+    Yields:
+    tuple: The header, sequence and quality string of each record, in file order.
+
+    Raises:
+    InputFileNotFoundError: If the file specified by filepath does not exist.
+    EmptyFileError: If the file is empty.
+    GeneralFASTAError: For any other errors encountered during file reading.
+    """
+    for header, sequence, quality in _iter_fastq_records(filepath):
+        if as_bytes:
+            yield header, sequence, quality
+            continue
+        try:
+            yield header, sequence.decode(), quality.decode()
+        except UnicodeDecodeError as e:
+            raise GeneralFASTAError(filepath, str(e)) from e
+
+def read_fastq(filepath: str, as_bytes: bool = False) -> dict:
+    """
+    Reads a FASTQ file and returns a dictionary with headers as keys and sequences as values.
+
+    The whole file is kept in memory; use iter_fastq to stream large files record by record.
+
+    Parameters:
+    filepath (str): The path to the FASTQ file.
+    as_bytes (bool): If True, the sequences are ASCII bytes instead of str.
+
+    Returns:
+    dict: A dictionary where the keys are headers and the values are sequences.
+
+    Raises:
+    InputFileNotFoundError: If the file specified by filepath does not exist.
+    EmptyFileError: If the file is empty.
+    GeneralFASTAError: For any other errors encountered during file reading.
+    """
+    # The quality strings are dropped, so they are read as bytes and never decoded
+    records = _iter_fastq_records(filepath)
+    if as_bytes:
+        return {header: sequence for header, sequence, _ in records}
+    try:
+        return {header: sequence.decode() for header, sequence, _ in records}
+    except UnicodeDecodeError as e:
+        raise GeneralFASTAError(filepath, str(e)) from e
 
 def GC(sequence: str) -> float:
     """
     Calculate the GC content of a DNA sequence.
     
     Parameters:
-    dna_sequence (str): A string representing the DNA sequence.
+    dna_sequence (str or bytes): A string representing the DNA sequence.
     
     Returns:
     float: The GC content percentage.
     """
-    if sequence.islower():
-        sequence = sequence.upper()
-    
-    if not sequence:
+    if not len(sequence):
         return 0.0
 
-    gc_count = 0
-    for base in sequence:
-        if base in ['G', 'C']:
-            gc_count += 1
+    if _simd_gc_count is not None and len(sequence) > _SIMD_MIN_LEN:
+        data = _as_uint8(sequence)
+        return round((_simd_gc_count(data.ctypes.data, len(data)) / len(sequence)) * 100, 4)
+    if _NUMBA_AVAILABLE and len(sequence) >= _NUMBA_STATS_MIN_LEN:
+        return fast_stats(sequence)[5]
+    if len(sequence) < _GC_NUMPY_MIN_LEN and isinstance(sequence, str):
+        # str.count scans in C without an upper-cased copy of the sequence
+        gc_count = sequence.count('G') + sequence.count('C') + sequence.count('g') + sequence.count('c')
+    else:
+        # Setting bit 0x20 folds 'G'/'C' onto 'g'/'c', so two vectorized compares cover both cases
+        folded = _as_uint8(sequence) | 0x20
+        gc_count = int(np.count_nonzero(folded == ord('g')) + np.count_nonzero(folded == ord('c')))
 
     gc_percentage = round((gc_count / len(sequence)) * 100, 4)
     return gc_percentage
@@ -139,18 +359,32 @@ def count_nucleotides(sequence: str, plot: bool = False) -> dict:
     Count the number of each nucleotide in a DNA sequence.
     
     Parameters:
-    sequence (str): A string representing the DNA sequence.
+    sequence (str or bytes): A string representing the DNA sequence.
     plot (bool): If True, plots a bar graph of the nucleotide counts.
     
     Returns:
     dict: A dictionary with nucleotides as keys and their counts as values.
     """
-    if sequence.islower():
-        sequence = sequence.upper()
-    
-    nuc_dict = {'A': 0, 'C': 0, 'G': 0, 'T': 0}
-    for base in sequence:
-        nuc_dict[base] = nuc_dict.get(base, 0) + 1
+    nuc_dict = None
+    if _NUMBA_AVAILABLE and len(sequence) >= _NUMBA_STATS_MIN_LEN:
+        a, c, g, t, n, _ = fast_stats(sequence)
+        # The fused kernel only knows ACGTN; other symbols need the full histogram below
+        if a + c + g + t + n == len(sequence):
+            nuc_dict = {'A': a, 'C': c, 'G': g, 'T': t}
+            if n:
+                nuc_dict['N'] = n
+
+    if nuc_dict is None:
+        # One histogram pass over the raw bytes; lower-case bases are added to their upper-case bins
+        counts = np.bincount(_as_uint8(sequence), minlength=256)
+        counts[ord('A'):ord('Z') + 1] += counts[ord('a'):ord('z') + 1]
+        counts[ord('a'):ord('z') + 1] = 0
+
+        nuc_dict = {base: int(counts[code]) for base, code in zip('ACGT', b'ACGT')}
+        counts[list(b'ACGT')] = 0
+        # Any other symbols (e.g. N) keep their own entries, as before
+        for code in np.flatnonzero(counts):
+            nuc_dict[chr(code)] = int(counts[code])
 
     N = len(sequence)
 
@@ -174,20 +408,18 @@ def count_dinucleotides(sequence: str, plot: bool = False) -> dict:
     Count the number of each dinucleotide in a DNA sequence.
 
     Parameters:
-    sequence (str): A string representing the DNA sequence.
+    sequence (str or bytes): A string representing the DNA sequence.
     plot (bool): If True, plots a bar graph of the dinucleotide counts.
 
     Returns:
     dict: A dictionary with dinucleotides as keys and their counts as values.
     """
-    if sequence.islower():
-        sequence = sequence.upper()
-    
-    dinuc_dict = {''.join(pair): 0 for pair in product('ACGT', repeat=2)}
+    # 2-bit code of every base; pairs touching any other symbol (e.g. N) are not counted
+    codes = _NUC_CODES[_as_uint8(sequence)]
+    valid = (codes[:-1] < 4) & (codes[1:] < 4)
+    counts = np.bincount(((codes[:-1] << 2) | codes[1:])[valid], minlength=16)
 
-    for i in range(len(sequence) - 1):
-        dinuc = sequence[i:i+2]
-        dinuc_dict[dinuc] = dinuc_dict.get(dinuc, 0) + 1
+    dinuc_dict = dict(zip(_DINUCLEOTIDES, counts.tolist()))
     
     total = sum(dinuc_dict.values())
 
@@ -211,20 +443,20 @@ def count_codons(sequence: str, plot: bool = False) -> dict:
     Count the number of each codon in a DNA sequence.
 
     Parameters:
-    sequence (str): A string representing the DNA sequence.
+    sequence (str or bytes): A string representing the DNA sequence.
     plot (bool): If True, generates a heatmap of the codon counts.
 
     Returns:
     dict: A dictionary with codons as keys and their counts as values.
     """
-    if sequence.islower():
-        sequence = sequence.upper()
-    
-    codon_dict = {''.join(codon): 0 for codon in product('ACGT', repeat=3)}
+    # 2-bit codes of the complete codons, one codon per row; codons with any other symbol are not counted
+    codes = _NUC_CODES[_as_uint8(sequence)]
+    codes = codes[:len(codes) - len(codes) % 3].reshape(-1, 3)
+    valid = (codes < 4).all(axis=1)
+    # With A, C, G, T coded 0..3 the packed index already follows the product('ACGT', repeat=3) order
+    counts = np.bincount(((codes[:, 0] << 4) | (codes[:, 1] << 2) | codes[:, 2])[valid], minlength=64)
 
-    for i in range(0, len(sequence) - 2, 3):
-        codon = sequence[i:i+3]
-        codon_dict[codon] = codon_dict.get(codon, 0) + 1
+    codon_dict = dict(zip(_CODONS, counts.tolist()))
 
     if plot:
         codon_matrix = np.array(list(codon_dict.values())).reshape(8, 8)
@@ -251,60 +483,75 @@ def complement(dna: str) -> str:
     Generate the complement of a DNA sequence.
 
     Parameters:
-    dna (str): A string representing the DNA sequence.
+    dna (str or bytes-like): A string representing the DNA sequence. Bytes are complemented without decoding.
 
     Returns:
-    str: The complementary DNA sequence.
+    str: The complementary DNA sequence (bytes for bytes or memoryview input, bytearray for bytearray input). The case of each base is kept and
+    symbols other than A, C, G and T become N.
     """
-    # Convert to uppercase if the input is in lowercase
-    if dna.islower():
-        dna = dna.upper()
-    
-    # Dictionary for complement bases
-    complement_dict = {'A': 'T', 'C': 'G', 'G': 'C', 'T': 'A'}
-    
-    # Generate complement sequence using list comprehension
-    complement_dna = "".join([complement_dict.get(base, 'N') for base in dna])
-    return complement_dna
+    # A single C-level table lookup per base; memoryview has no translate(), so it is copied to bytes
+    if isinstance(dna, _BYTES_LIKE):
+        return (bytes(dna) if isinstance(dna, memoryview) else dna).translate(_COMPLEMENT_BYTES)
+    return dna.translate(_COMPLEMENT_TABLE)
 
 def reverse_complement(dna: str) -> str:
     """
     Generate the reverse complement of a DNA sequence.
 
     Parameters:
-    dna (str): A string representing the DNA sequence.
+    dna (str or bytes-like): A string representing the DNA sequence.
 
     Returns:
-    str: The reverse complementary DNA sequence.
+    str: The reverse complementary DNA sequence (bytes for bytes input).
     """
     # Get the complement and then reverse the sequence
-    rev_complement_dna = complement(dna)[::-1]
-    return rev_complement_dna
+    return complement(dna)[::-1]
 
 def transcribe(dna: str) -> str:
     """
     Transcribe a DNA sequence into RNA.
 
     Parameters:
-    dna (str): A string representing the DNA sequence.
+    dna (str or bytes-like): A string representing the DNA sequence. Bytes are transcribed without decoding.
 
     Returns:
-    str: The transcribed RNA sequence.
+    str: The transcribed RNA sequence (bytes for bytes or memoryview input, bytearray for bytearray input).
     """
-    # Convert to uppercase if the input is in lowercase
-    if dna.islower():
-        dna = dna.upper()
-    
-    # Replace all thymine (T) with uracil (U)
-    rna = dna.replace("T", "U")
-    return rna
+    # Replace all thymine (T) with uracil (U) in one pass, keeping the case of each base
+    if isinstance(dna, _BYTES_LIKE):
+        return (bytes(dna) if isinstance(dna, memoryview) else dna).translate(_TRANSCRIBE_BYTES)
+    return dna.translate(_TRANSCRIBE_TABLE)
+
+def _validate_for_translation(dna, table: int) -> np.ndarray:
+    """
+    Validate a DNA sequence and codon table ID for translation and return the ASCII codes of the sequence.
+
+    Bytes-like sequences are validated and returned as a uint8 view, without a copy.
+
+    Raises:
+        ValueError: If the DNA sequence contains invalid characters or the table ID is unknown.
+    """
+    if table not in _VALID_TABLE_IDS:
+        raise ValueError(f"Invalid table ID: {table}. Valid table IDs are {_VALID_TABLE_IDS}")
+
+    # _NUC_CODES covers both cases, so no upper-cased copy is checked; every other byte, including
+    # the '?' that replaces non-ASCII characters, maps to 255 and fails validation in the same pass
+    data = _as_uint8(dna)
+    if _NUC_CODES[data].max(initial=0) == 255:
+        raise ValueError("Invalid DNA sequence: Contains characters other than A, T, C, G")
+    return data
+
+def _codon_keys(codes: np.ndarray) -> np.ndarray:
+    """Pack the complete codons of 2-bit base codes into their 6-bit keys, ignoring incomplete trailing bases."""
+    codes = codes[:len(codes) - len(codes) % 3].reshape(-1, 3)
+    return (codes[:, 0] << 4) | (codes[:, 1] << 2) | codes[:, 2]
 
 def translate(dna: str, table: int = 1) -> str:
     """
     Translates a DNA sequence into a protein sequence using the specified codon table.
 
     Args:
-        dna (str): The DNA sequence to be translated. It is expected to be a string of nucleotide bases (A, T, C, G).
+        dna (str or bytes): The DNA sequence to be translated. It is expected to be a string of nucleotide bases (A, T, C, G).
         table (int, optional): The index of the codon table to use for translation. Defaults to 1.
 
     Returns:
@@ -313,29 +560,12 @@ def translate(dna: str, table: int = 1) -> str:
     Raises:
         ValueError: If the DNA sequence contains invalid characters or if the length of the DNA sequence is not a multiple of 3.
     """
-    # Convert the DNA sequence to uppercase if it is in lowercase
-    if dna.islower():
-        dna = dna.upper()
-    # Get sequence length
-    N = len(dna)
-    
-    # Validate DNA sequence
-    valid_bases = {'A', 'T', 'C', 'G'}
-    if not set(dna).issubset(valid_bases):
-        raise ValueError("Invalid DNA sequence: Contains characters other than A, T, C, G")
-    valid_table_id = [1, 2, 3, 4, 5, 6, 9, 10, 11, 12, 13, 14, 15, 16,
-                      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33]
-    if table not in valid_table_id:
-        raise ValueError(f"Invalid table ID: {table}. Valid table IDs are {valid_table_id}")
-    if N % 3 != 0:
+    data = _validate_for_translation(dna, table)
+    if len(data) % 3 != 0:
         print("Warning: DNA sequence length is not a multiple of 3. The incomplete trailing bases will be ignored.")
 
-    # Retrieve the codon table from the provided tables dictionary
-    codon_table = tables[int(table)]['table']
-
-    # Translate DNA sequence to protein sequence
-    protein = "".join([codon_table[dna[i:i+3]] for i in range(0, N - (N%3), 3)])
-
+    # translate_bytes encodes and looks up each codon in a single pass (a Numba kernel when available)
+    protein = translate_bytes(data, int(table)).tobytes().decode('ascii')
     return protein
 
 def translate_in_six_frames(dna: str, table: int = 1) -> dict:
@@ -343,20 +573,28 @@ def translate_in_six_frames(dna: str, table: int = 1) -> dict:
     Translates a DNA sequence in all six reading frames.
 
     Args:
-        dna (str): The DNA sequence to be translated.
+        dna (str or bytes): The DNA sequence to be translated.
         table (int, optional): The index of the codon table to use for translation. Defaults to 1.
 
     Returns:
         dict: A dictionary with six translated protein sequences corresponding to the six reading frames.
-    """
-    # Get the reverse complement of the DNA sequence
-    rev_dna = reverse_complement(dna)
 
-    # Perform six-frame translation
+    Raises:
+        ValueError: If the DNA sequence contains invalid characters or the table ID is unknown.
+    """
+    # Encode and pack the codon keys of the three forward frames once
+    codes = _NUC_CODES[_validate_for_translation(dna, table)]
+    keys = [_codon_keys(codes[frame:]) for frame in range(3)]
+    codon_lut = tables[int(table)].codon_lut
+    rc_codon_lut = tables[int(table)].rc_codon_lut
+
+    # Perform six-frame translation. Reverse frame f reads the reverse complements of the forward
+    # codons that end f bases before the end of the sequence, i.e. the codons of forward frame
+    # (len - f) % 3, last to first; rc_codon_lut translates them without a reverse complement strand
     frames = {}
     for frame in range(3):
-        frames[f"{frame + 1}"] = translate(dna[frame:], table)
-        frames[f"-{frame + 1}"] = translate(rev_dna[frame:], table)
+        frames[f"{frame + 1}"] = codon_lut[keys[frame]].tobytes().decode('ascii')
+        frames[f"-{frame + 1}"] = rc_codon_lut[keys[(len(codes) - frame) % 3][::-1]].tobytes().decode('ascii')
     
     return frames
 
@@ -365,8 +603,8 @@ def hamming_distance(seqA: str, seqB: str) -> int:
     Calculate the Hamming distance between two DNA sequences.
 
     Parameters:
-    seqA (str): The first DNA sequence.
-    seqB (str): The second DNA sequence.
+    seqA (str or bytes): The first DNA sequence.
+    seqB (str or bytes): The second DNA sequence.
 
     Returns:
     int: The Hamming distance between the two sequences.
@@ -374,9 +612,17 @@ def hamming_distance(seqA: str, seqB: str) -> int:
     # Ensure both sequences are of equal length
     assert len(seqA) == len(seqB), "The DNA sequences must be of equal length."
 
-    # Count the number of differing bases
-    distance = sum([1 for base1, base2 in zip(seqA, seqB) if base1 != base2])
-    return distance
+    if any(isinstance(seq, str) and not seq.isascii() for seq in (seqA, seqB)):
+        return sum([1 for base1, base2 in zip(seqA, seqB) if base1 != base2])
+
+    # Compare the byte views of both sequences in one vectorized pass
+    a = _as_uint8(seqA)
+    b = _as_uint8(seqB)
+    if _simd_hamming is not None and len(a) > _SIMD_MIN_LEN:
+        return _simd_hamming(a.ctypes.data, b.ctypes.data, len(a))
+    if _NUMBA_AVAILABLE and len(a) >= _NUMBA_STATS_MIN_LEN:
+        return int(mismatches(a, b))
+    return int(np.count_nonzero(a != b))
 
 def transition_transversion_ratio(seqA: str, seqB: str) -> float:
     """
@@ -384,23 +630,22 @@ def transition_transversion_ratio(seqA: str, seqB: str) -> float:
     The transition/transversion ratio between homologous strands of DNA is generally about 2.
 
     Parameters:
-    seqA (str): The first DNA sequence.
-    seqB (str): The second DNA sequence.
+    seqA (str or bytes): The first DNA sequence.
+    seqB (str or bytes): The second DNA sequence.
 
     Returns:
     float: The transition/transversion ratio.
     """
     assert len(seqA) == len(seqB), "The DNA sequences must be of equal length."
 
-    transitions, transversions = 0, 0
-    transition_pairs = {('A', 'G'), ('G', 'A'), ('C', 'T'), ('T', 'C')}
-
-    for base1, base2 in zip(seqA, seqB):
-        if base1 != base2:
-            if (base1, base2) in transition_pairs:
-                transitions += 1
-            else:
-                transversions += 1
+    # 2-bit codes in either case, other symbols map to 255
+    a = _NUC_CODES[_as_uint8(seqA)]
+    b = _NUC_CODES[_as_uint8(seqB)]
+    differ = a != b
+    # With A, C, G, T coded 0..3 the transitions A<->G and C<->T are exactly the pairs whose codes
+    # differ in bit 1 only; every other difference, including one against N, is a transversion
+    transitions = int(np.count_nonzero(differ & ((a ^ b) == 2)))
+    transversions = int(np.count_nonzero(differ)) - transitions
 
     if transversions == 0:
         return float('inf') if transitions > 0 else float('nan')
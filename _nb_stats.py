@@ -0,0 +1,54 @@
+"""
+Numba kernels for single-pass sequence statistics, used by SeqAnalysis.py for long sequences.
+
+Each kernel walks a uint8 view of the sequence once. The loops are split over the Numba threads with
+prange and the per-thread counts are combined as reductions, so several statistics that would need a
+NumPy pass each are gathered in one pass over memory.
+"""
+from typing import Tuple
+import numpy as np
+from numba import njit, prange
+
+@njit(cache=True, parallel=True, fastmath=True)
+def base_stats(arr: np.ndarray) -> Tuple[int, int, int, int, int]:
+    """Count A, C, G, T and N in either case in the ASCII codes `arr`."""
+    a = c = g = t = n = 0
+    for i in prange(arr.size):
+        # Setting bit 0x20 folds upper case onto lower case
+        base = arr[i] | 0x20
+        a += base == ord('a')
+        c += base == ord('c')
+        g += base == ord('g')
+        t += base == ord('t')
+        n += base == ord('n')
+    return a, c, g, t, n
+
+@njit(cache=True, parallel=True, fastmath=True)
+def mismatches(x: np.ndarray, y: np.ndarray) -> int:
+    """Count the positions at which the equally long arrays `x` and `y` differ."""
+    count = 0
+    for i in prange(x.size):
+        count += x[i] != y[i]
+    return count
+
+def fast_stats(sequence: str) -> Tuple[int, int, int, int, int, float]:
+    """
+    Count the bases of a DNA sequence and compute its GC content in a single pass.
+
+    Parameters:
+    sequence (str or bytes): A string representing the DNA sequence. Bytes-like input is used without a copy.
+
+    Returns:
+    tuple: The counts of A, C, G, T and N (case-insensitive) and the GC content percentage.
+    """
+    if isinstance(sequence, str):
+        sequence = sequence.encode('ascii', 'replace')
+    a, c, g, t, n = base_stats(np.frombuffer(sequence, dtype=np.uint8))
+    gc_percentage = round(((g + c) / len(sequence)) * 100, 4) if len(sequence) else 0.0
+    return int(a), int(c), int(g), int(t), int(n), gc_percentage
+
+# Compile (or load from the on-disk cache) once at import so the first call is not charged for the JIT.
+_warmup = np.zeros(1, dtype=np.uint8)
+base_stats(_warmup)
+mismatches(_warmup, _warmup)
+del _warmup
@@ -0,0 +1,96 @@
+/*
+ * SIMD byte-counting kernels for GC content and Hamming distance in SeqAnalysis.py.
+ *
+ * Each kernel compares 16 (SSE2) or 32 (AVX2) bytes per step, turns the compare result into a bit
+ * mask with movemask and adds its popcount. GC counting folds upper case onto lower case by setting
+ * bit 0x20, so 'G', 'g', 'C' and 'c' are all counted with two compares.
+ *
+ * SSE2 is part of the x86-64 baseline; the AVX2 variants are compiled through a target attribute, so
+ * the library loads on any x86-64 CPU and biohub_simd_has_avx2 tells the caller whether to use them.
+ *
+ * Built as a shared library next to SeqAnalysis.py by `python setup.py build_ext --inplace`, or by hand:
+ *     gcc -O3 -shared -fPIC -o _seq_simd.so _seq_simd.c
+ */
+#include <immintrin.h>
+#include <stddef.h>
+#include <stdint.h>
+
+int biohub_simd_has_avx2(void)
+{
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx2");
+}
+
+static size_t gc_count_tail(const uint8_t *seq, size_t i, size_t n, size_t count)
+{
+    for (; i < n; i++) {
+        uint8_t base = seq[i] | 0x20;
+        count += (base == 'g') | (base == 'c');
+    }
+    return count;
+}
+
+static size_t hamming_tail(const uint8_t *a, const uint8_t *b, size_t i, size_t n, size_t count)
+{
+    for (; i < n; i++)
+        count += a[i] != b[i];
+    return count;
+}
+
+/* Count the G and C bases, in either case, among the n bytes of seq. */
+size_t gc_count_sse2(const uint8_t *seq, size_t n)
+{
+    const __m128i fold = _mm_set1_epi8(0x20);
+    const __m128i g = _mm_set1_epi8('g');
+    const __m128i c = _mm_set1_epi8('c');
+    size_t count = 0, i = 0;
+
+    for (; i + 16 <= n; i += 16) {
+        __m128i v = _mm_or_si128(_mm_loadu_si128((const __m128i *)(seq + i)), fold);
+        __m128i hit = _mm_or_si128(_mm_cmpeq_epi8(v, g), _mm_cmpeq_epi8(v, c));
+        count += __builtin_popcount((unsigned)_mm_movemask_epi8(hit));
+    }
+    return gc_count_tail(seq, i, n, count);
+}
+
+__attribute__((target("avx2,popcnt")))
+size_t gc_count_avx2(const uint8_t *seq, size_t n)
+{
+    const __m256i fold = _mm256_set1_epi8(0x20);
+    const __m256i g = _mm256_set1_epi8('g');
+    const __m256i c = _mm256_set1_epi8('c');
+    size_t count = 0, i = 0;
+
+    for (; i + 32 <= n; i += 32) {
+        __m256i v = _mm256_or_si256(_mm256_loadu_si256((const __m256i *)(seq + i)), fold);
+        __m256i hit = _mm256_or_si256(_mm256_cmpeq_epi8(v, g), _mm256_cmpeq_epi8(v, c));
+        count += __builtin_popcount((unsigned)_mm256_movemask_epi8(hit));
+    }
+    return gc_count_tail(seq, i, n, count);
+}
+
+/* Count the positions at which the n bytes of a and b differ. */
+size_t hamming_sse2(const uint8_t *a, const uint8_t *b, size_t n)
+{
+    size_t count = 0, i = 0;
+
+    for (; i + 16 <= n; i += 16) {
+        __m128i eq = _mm_cmpeq_epi8(_mm_loadu_si128((const __m128i *)(a + i)),
+                                    _mm_loadu_si128((const __m128i *)(b + i)));
+        count += __builtin_popcount(~(unsigned)_mm_movemask_epi8(eq) & 0xFFFFu);
+    }
+    return hamming_tail(a, b, i, n, count);
+}
+
+__attribute__((target("avx2,popcnt")))
+size_t hamming_avx2(const uint8_t *a, const uint8_t *b, size_t n)
+{
+    size_t count = 0, i = 0;
+
+    for (; i + 32 <= n; i += 32) {
+        __m256i eq = _mm256_cmpeq_epi8(_mm256_loadu_si256((const __m256i *)(a + i)),
+                                       _mm256_loadu_si256((const __m256i *)(b + i)));
+        count += __builtin_popcount(~(unsigned)_mm256_movemask_epi8(eq));
+    }
+    return hamming_tail(a, b, i, n, count);
+}
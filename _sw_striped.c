@@ -0,0 +1,220 @@
+/*
+ * Striped Smith-Waterman score kernels (Farrar, 2007) using int16 SIMD arithmetic.
+ *
+ * The query is split into LANES interleaved stripes so that one vector holds LANES query positions
+ * that are segLen rows apart; a column of the DP matrix is then swept with segLen vector updates plus
+ * the lazy-F correction loop. Only the best local score is computed, the traceback stays in NumPy.
+ *
+ * The same kernel is instantiated for SSE4.1 (8 lanes), AVX2 (16 lanes) and AVX-512BW (32 lanes).
+ * Each variant is compiled for its instruction set through a target attribute, so the library itself
+ * loads on any x86-64 CPU and the biohub_has_* probes tell the caller which variants may be used.
+ *
+ * Built as a shared library next to SeqAlign.py by `python setup.py build_ext --inplace`, or by hand:
+ *     gcc -O3 -shared -fPIC -o _sw_striped.so _sw_striped.c
+ */
+#include <immintrin.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+int biohub_has_sse41(void)
+{
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("sse4.1");
+}
+
+int biohub_has_avx2(void)
+{
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx2");
+}
+
+int biohub_has_avx512bw(void)
+{
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx512bw");
+}
+
+/*
+ * Return the best Smith-Waterman score of a (length M) against b (length N).
+ *
+ * a and b hold indices into the row-major alphabet_size x alphabet_size substitution matrix sub.
+ * gap must be negative. Returns -1 when the score saturates the int16 range and -2 when memory
+ * cannot be allocated; the caller is expected to fall back to a wider kernel in both cases.
+ *
+ * The body is shared by all instruction sets; it is written against the VEC_* operations, which
+ * each variant defines before expanding it.
+ */
+#define SW_STRIPED_BODY                                                                         \
+    int segLen = (M + LANES - 1) / LANES;                                                       \
+    if (M == 0 || N == 0)                                                                       \
+        return 0;                                                                               \
+                                                                                                \
+    size_t profile_bytes = (size_t)alphabet_size * segLen * sizeof(VEC);                        \
+    size_t column_bytes = (size_t)segLen * sizeof(VEC);                                         \
+    VEC *vProfile = aligned_alloc(sizeof(VEC), profile_bytes);                                  \
+    VEC *pvHStore = aligned_alloc(sizeof(VEC), column_bytes);                                   \
+    VEC *pvHLoad = aligned_alloc(sizeof(VEC), column_bytes);                                    \
+    if (!vProfile || !pvHStore || !pvHLoad) {                                                   \
+        free(vProfile);                                                                         \
+        free(pvHStore);                                                                         \
+        free(pvHLoad);                                                                          \
+        return -2;                                                                              \
+    }                                                                                           \
+                                                                                                \
+    /* Query profile: vProfile[c * segLen + s] lane l = sub[a[l * segLen + s], c]. */           \
+    for (int c = 0; c < alphabet_size; c++) {                                                   \
+        int16_t *p = (int16_t *)(vProfile + (size_t)c * segLen);                                \
+        for (int s = 0; s < segLen; s++) {                                                      \
+            for (int l = 0; l < LANES; l++) {                                                   \
+                int i = l * segLen + s;                                                         \
+                p[s * LANES + l] = i < M ? sub[a[i] * alphabet_size + c] : INT16_MIN / 2;       \
+            }                                                                                   \
+        }                                                                                       \
+    }                                                                                           \
+    memset(pvHStore, 0, column_bytes);                                                          \
+    memset(pvHLoad, 0, column_bytes);                                                           \
+                                                                                                \
+    const VEC vZero = VEC_ZERO();                                                               \
+    const VEC vGap = VEC_SET1((int16_t)-gap);                                                   \
+    VEC vMax = vZero;                                                                           \
+                                                                                                \
+    for (int j = 0; j < N; j++) {                                                               \
+        const VEC *vP = vProfile + (size_t)b[j] * segLen;                                       \
+        VEC vF = vZero;                                                                         \
+        VEC vH = VEC_SHIFT(VEC_LOAD(pvHStore + segLen - 1));                                    \
+        VEC *tmp = pvHLoad;                                                                     \
+        pvHLoad = pvHStore;                                                                     \
+        pvHStore = tmp;                                                                         \
+                                                                                                \
+        for (int s = 0; s < segLen; s++) {                                                      \
+            vH = VEC_ADDS(vH, VEC_LOAD(vP + s));                                                \
+            vH = VEC_MAX(vH, VEC_SUBS(VEC_LOAD(pvHLoad + s), vGap));                            \
+            vH = VEC_MAX(vH, vF);                                                               \
+            vH = VEC_MAX(vH, vZero);                                                            \
+            vMax = VEC_MAX(vMax, vH);                                                           \
+            VEC_STORE(pvHStore + s, vH);                                                        \
+            vF = VEC_SUBS(vH, vGap);                                                            \
+            vH = VEC_LOAD(pvHLoad + s);                                                         \
+        }                                                                                       \
+                                                                                                \
+        /* Lazy-F: carry the vertical gaps across stripe boundaries until they stop improving H. */ \
+        vF = VEC_SHIFT(vF);                                                                     \
+        int s = 0;                                                                              \
+        vH = VEC_LOAD(pvHStore);                                                                \
+        while (VEC_ANY_GT(vF, vH)) {                                                            \
+            vH = VEC_MAX(vH, vF);                                                               \
+            vMax = VEC_MAX(vMax, vH);                                                           \
+            VEC_STORE(pvHStore + s, vH);                                                        \
+            vF = VEC_SUBS(vF, vGap);                                                            \
+            if (++s >= segLen) {                                                                \
+                s = 0;                                                                          \
+                vF = VEC_SHIFT(vF);                                                             \
+            }                                                                                   \
+            vH = VEC_LOAD(pvHStore + s);                                                        \
+        }                                                                                       \
+    }                                                                                           \
+                                                                                                \
+    int16_t lanes[LANES];                                                                       \
+    VEC_STOREU(lanes, vMax);                                                                    \
+    int best = 0;                                                                               \
+    for (int l = 0; l < LANES; l++)                                                             \
+        if (lanes[l] > best)                                                                    \
+            best = lanes[l];                                                                    \
+                                                                                                \
+    free(vProfile);                                                                             \
+    free(pvHStore);                                                                             \
+    free(pvHLoad);                                                                              \
+    return best >= INT16_MAX ? -1 : best;
+
+/* SSE4.1: 8 lanes. */
+#define LANES 8
+#define VEC __m128i
+#define VEC_ZERO() _mm_setzero_si128()
+#define VEC_SET1(x) _mm_set1_epi16(x)
+#define VEC_LOAD(p) _mm_load_si128(p)
+#define VEC_STORE(p, v) _mm_store_si128(p, v)
+#define VEC_STOREU(p, v) _mm_storeu_si128((__m128i *)(p), v)
+#define VEC_ADDS(x, y) _mm_adds_epi16(x, y)
+#define VEC_SUBS(x, y) _mm_subs_epi16(x, y)
+#define VEC_MAX(x, y) _mm_max_epi16(x, y)
+#define VEC_SHIFT(v) _mm_slli_si128(v, 2)
+#define VEC_ANY_GT(x, y) _mm_movemask_epi8(_mm_cmpgt_epi16(x, y))
+
+__attribute__((target("sse4.1")))
+int sw_striped_sse41(const uint8_t *a, int M, const uint8_t *b, int N,
+                     const int16_t *sub, int alphabet_size, int16_t gap)
+{
+    SW_STRIPED_BODY
+}
+
+#undef LANES
+#undef VEC
+#undef VEC_ZERO
+#undef VEC_SET1
+#undef VEC_LOAD
+#undef VEC_STORE
+#undef VEC_STOREU
+#undef VEC_ADDS
+#undef VEC_SUBS
+#undef VEC_MAX
+#undef VEC_SHIFT
+#undef VEC_ANY_GT
+
+/* AVX2: 16 lanes. Shifting every int16 lane up by one crosses the 128-bit halves, so the low half
+ * is first moved up with a permute and then spliced in with alignr. */
+#define LANES 16
+#define VEC __m256i
+#define VEC_ZERO() _mm256_setzero_si256()
+#define VEC_SET1(x) _mm256_set1_epi16(x)
+#define VEC_LOAD(p) _mm256_load_si256(p)
+#define VEC_STORE(p, v) _mm256_store_si256(p, v)
+#define VEC_STOREU(p, v) _mm256_storeu_si256((__m256i *)(p), v)
+#define VEC_ADDS(x, y) _mm256_adds_epi16(x, y)
+#define VEC_SUBS(x, y) _mm256_subs_epi16(x, y)
+#define VEC_MAX(x, y) _mm256_max_epi16(x, y)
+#define VEC_SHIFT(v) _mm256_alignr_epi8(v, _mm256_permute2x128_si256(v, v, 0x08), 14)
+#define VEC_ANY_GT(x, y) _mm256_movemask_epi8(_mm256_cmpgt_epi16(x, y))
+
+__attribute__((target("avx2")))
+int sw_striped_avx2(const uint8_t *a, int M, const uint8_t *b, int N,
+                    const int16_t *sub, int alphabet_size, int16_t gap)
+{
+    SW_STRIPED_BODY
+}
+
+#undef LANES
+#undef VEC
+#undef VEC_ZERO
+#undef VEC_SET1
+#undef VEC_LOAD
+#undef VEC_STORE
+#undef VEC_STOREU
+#undef VEC_ADDS
+#undef VEC_SUBS
+#undef VEC_MAX
+#undef VEC_SHIFT
+#undef VEC_ANY_GT
+
+/* AVX-512BW: 32 lanes. The lane shift is a word permute by one position with lane 0 masked to zero. */
+#define LANES 32
+#define VEC __m512i
+#define VEC_ZERO() _mm512_setzero_si512()
+#define VEC_SET1(x) _mm512_set1_epi16(x)
+#define VEC_LOAD(p) _mm512_load_si512(p)
+#define VEC_STORE(p, v) _mm512_store_si512(p, v)
+#define VEC_STOREU(p, v) _mm512_storeu_si512((void *)(p), v)
+#define VEC_ADDS(x, y) _mm512_adds_epi16(x, y)
+#define VEC_SUBS(x, y) _mm512_subs_epi16(x, y)
+#define VEC_MAX(x, y) _mm512_max_epi16(x, y)
+#define VEC_SHIFT(v) _mm512_maskz_permutexvar_epi16(0xFFFFFFFEu, vShiftIdx, v)
+#define VEC_ANY_GT(x, y) _mm512_cmpgt_epi16_mask(x, y)
+
+__attribute__((target("avx512f,avx512bw")))
+int sw_striped_avx512(const uint8_t *a, int M, const uint8_t *b, int N,
+                      const int16_t *sub, int alphabet_size, int16_t gap)
+{
+    const __m512i vShiftIdx = _mm512_set_epi16(30, 29, 28, 27, 26, 25, 24, 23, 22, 21, 20, 19, 18, 17, 16, 15,
+                                               14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0, 0);
+    SW_STRIPED_BODY
+}
@@ -1,197 +1,369 @@
 """
 Reference for genetic codes: https://www.ncbi.nlm.nih.gov/Taxonomy/Utils/wprintgc.cgi?
 The print-form ASN.1 version of this document is in the gc.prt file.
+
+Every table in `tables` is a GeneticCode holding NumPy lookup arrays indexed by a 6-bit codon key.
+Each base is coded in 2 bits (A=0, C=1, G=2, T=3) and a codon XYZ has the key (X << 4) | (Y << 2) | Z.
+NT_ENCODE maps ASCII bytes to these codes (either case, U as T) and every other byte, including the
+IUPAC ambiguity codes, to 255, so a sequence is encoded with NT_ENCODE[np.frombuffer(seq, np.uint8)]
+and translated with one gather:
+    tables[i].codon_lut[keys]       ASCII code of the amino acid (uint8)
+    tables[i].start_lut[keys]       True for start codons (bool)
+    tables[i].stop_lut[keys]        True for stop codons (bool)
+
+The arrays of all tables are also stacked into ALL_CODON_LUT, ALL_START_LUT and ALL_STOP_LUT, with
+one row per table ID (rows of unused IDs are zero), so ALL_CODON_LUT[table_id, keys] translates with
+any code and the per-table arrays are views of those rows.
+
+For scalar tests, e.g. in an ORF scanner, the start and stop codons are also kept as np.uint64 bit masks
+with bit k set for codon key k: (tables[i].start_mask >> key) & 1. ALL_START_MASK and ALL_STOP_MASK
+stack them by table ID.
+
+For composition counts and substitution matrices, tables[i].codon_to_aaidx (rows of
+ALL_CODON_TO_AAIDX) maps a codon key straight to the index of its amino acid in AA_ORDER, e.g.
+np.bincount(codon_to_aaidx[keys], minlength=len(AA_ORDER)).
+
+tables[i].rc_codon_lut (rows of ALL_RC_CODON_LUT) gives, for a forward-strand codon key, the amino
+acid of the reverse complement of that codon, so reverse frames are translated from the forward
+strand's keys in reverse order without building the reverse complement sequence.
 """
+import sys
+from types import MappingProxyType
+from collections.abc import Mapping
+import numpy as np
+
+# Standard code (table 1) by the first two bases of the codon, with the amino acids for a third base of
+# T, C, A and G; every other table is built from it and its entry in OVERRIDES
+_STANDARD_QUADRANTS = {
+		'TT': 'FFLL', 'TC': 'SSSS', 'TA': 'YY**', 'TG': 'CC*W',
+		'CT': 'LLLL', 'CC': 'PPPP', 'CA': 'HHQQ', 'CG': 'RRRR',
+		'AT': 'IIIM', 'AC': 'TTTT', 'AA': 'NNKK', 'AG': 'SSRR',
+		'GT': 'VVVV', 'GC': 'AAAA', 'GA': 'DDEE', 'GG': 'GGGG'
+}
+
+# The built codon strings are interned like the literal codons in OVERRIDES, so all tables share the keys
+_STANDARD_TABLE = {sys.intern(prefix + base): amino_acid
+                   for prefix, amino_acids in _STANDARD_QUADRANTS.items()
+                   for base, amino_acid in zip('TCAG', amino_acids)}
+
+# Codons whose amino acid differs from the standard code, per table (as in the NCBI listing)
+OVERRIDES = {
+		2 : {'TGA': 'W', 'ATA': 'M', 'AGA': '*', 'AGG': '*'},
+		3 : {'TGA': 'W', 'CTT': 'T', 'CTC': 'T', 'CTA': 'T', 'CTG': 'T', 'ATA': 'M'},
+		4 : {'TGA': 'W'},
+		5 : {'TGA': 'W', 'ATA': 'M', 'AGA': 'S', 'AGG': 'S'},
+		6 : {'TAA': 'Q', 'TAG': 'Q'},
+		9 : {'TGA': 'W', 'AAA': 'N', 'AGA': 'S', 'AGG': 'S'},
+		10 : {'TGA': 'C'},
+		11 : {},
+		12 : {'CTG': 'S'},
+		13 : {'TGA': 'W', 'ATA': 'M', 'AGA': 'G', 'AGG': 'G'},
+		14 : {'TAA': 'Y', 'TGA': 'W', 'AAA': 'N', 'AGA': 'S', 'AGG': 'S'},
+		15 : {'TAG': 'Q'},
+		16 : {'TAG': 'L'},
+		21 : {'TGA': 'W', 'ATA': 'M', 'AAA': 'N', 'AGA': 'S', 'AGG': 'S'},
+		22 : {'TCA': '*', 'TAG': 'L'},
+		23 : {'TTA': '*'},
+		24 : {'TGA': 'W', 'AGA': 'S', 'AGG': 'K'},
+		25 : {'TGA': 'G'},
+		26 : {'CTG': 'A'},
+		27 : {'TAA': 'Q', 'TAG': 'Q', 'TGA': 'W'},
+		28 : {'TAA': 'Q', 'TAG': 'Q', 'TGA': 'W'},
+		29 : {'TAA': 'Y', 'TAG': 'Y'},
+		30 : {'TAA': 'E', 'TAG': 'E'},
+		31 : {'TAA': 'E', 'TAG': 'E', 'TGA': 'W'},
+		32 : {'TAG': 'W'},
+		33 : {'TAA': 'Y', 'TGA': 'W', 'AGA': 'S', 'AGG': 'K'}
+}
 
-tables = {
+# Name (where NCBI gives one), description, start codons and stop codons of each table
+_TABLE_INFO = {
 		1 : {
 			'name': 'SGC0',
 			'description': 'Standard',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['TTG', 'CTG', 'ATG'],
 			'stop_codons': ['TAA', 'TAG', 'TGA']
 		},
 		2 : {
 			'name': 'SGC1',
 			'description': 'Vertebrate Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'M', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': '*', 'AGG': '*', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATT', 'ATC', 'ATA', 'ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG', 'AGA', 'AGG']
 		},
 		3 : {
 			'name': 'SGC2',
 			'description': 'Yeast Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'T', 'CTC': 'T', 'CTA': 'T', 'CTG': 'T', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'M', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATA', 'ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		4 : {
 			'name': 'SGC3',
 			'description': 'Mold Mitochondrial; Protozoan Mitochondrial; Coelenterate Mitochondrial; Mycoplasma; Spiroplasma',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['TTA', 'TTG', 'CTG', 'ATT', 'ATC', 'ATA', 'ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		5 : {
 			'name': 'SGC4',
 			'description': 'Invertebrate Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'M', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'S', 'AGG': 'S', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['TTG', 'ATT', 'ATC', 'ATA', 'ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		6 : {
 			'name': 'SGC5',
 			'description': 'Ciliate Nuclear; Dasycladacean Nuclear; Hexamita Nuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': 'Q', 'TAG': 'Q', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TGA']
 		},
 		9 : {
 			'name': 'SGC8',
 			'description': 'Echinoderm Mitochondrial; Flatworm Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'N', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'S', 'AGG': 'S', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		10 : {
 			'name': 'SGC9',
 			'description': 'Euplotid Nuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'C', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		11 : {
-			'name': '',
 			'description': 'Bacterial, Archaeal and Plant Plastid',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['TTG', 'CTG', 'ATT', 'ATC', 'ATA', 'ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG', 'TGA']
 		},
 		12 : {
-			'name': '',
 			'description': 'Alternative Yeast Nuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'S', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['CTG', 'ATG'],
 			'stop_codons': ['TAA', 'TAG', 'TGA']
 		},
 		13 : {
-			'name': '',
 			'description': 'Ascidian Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'M', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'G', 'AGG': 'G', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['TTG', 'ATA', 'ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		14 : {
-			'name': '',
 			'description': 'Alternative Flatworm Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': 'Y', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'N', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'S', 'AGG': 'S', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TAG']
 		},
 		15 : {
-			'name': '',
 			'description': 'Blepharisma Macronuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': 'Q', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TAA', 'TGA']
 		},
 		16 : {
-			'name': '',
 			'description': 'Chlorophycean Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': 'L', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TAA', 'TGA']
 		},
 		21 : {
-			'name': '',
 			'description': 'Trematode Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'M', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'N', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'S', 'AGG': 'S', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		22 : {
-			'name': '',
 			'description': 'Scenedesmus obliquus Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': '*', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': 'L', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TCA', 'TAA', 'TGA']
 		},
 		23 : {
-			'name': '',
 			'description': 'Thraustochytrium Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': '*', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATT', 'ATG', 'GTG'],
 			'stop_codons': ['TTA', 'TAA', 'TAG', 'TGA']
 		},
 		24 : {
-			'name': '',
 			'description': 'Rhabdopleuridae Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'S', 'AGG': 'K', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['TTG', 'CTG', 'ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		25 : {
-			'name': '',
 			'description': 'Candidate Division SR1 and Gracilibacteria',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'G', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['TTG', 'ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		26 : {
-			'name': '',
 			'description': 'Pachysolen tannophilus Nuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'A', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['CTG', 'ATG'],
 			'stop_codons': ['TAA', 'TAG', 'TGA']
 		},
 		27 : {
-			'name': '',
 			'description': 'Karyorelict Nuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': 'Q', 'TAG': 'Q', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TGA']
 		},
 		28 : {
-			'name': '',
 			'description': 'Condylostoma Nuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': 'Q', 'TAG': 'Q', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TAA', 'TAG', 'TGA']
 		},
 		29 : {
-			'name': '',
 			'description': 'Mesodinium Nuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': 'Y', 'TAG': 'Y', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TGA']
 		},
 		30 : {
-			'name': '',
 			'description': 'Peritrich Nuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': 'E', 'TAG': 'E', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TGA']
 		},
 		31 : {
-			'name': '',
 			'description': 'Blastocrithidia Nuclear',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': 'E', 'TAG': 'E', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['ATG'],
 			'stop_codons': ['TAA', 'TAG']
 		},
 		32 : {
-			'name': '',
 			'description': 'Balanophoraceae Plastid',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': '*', 'TAG': 'W', 'TGT': 'C', 'TGC': 'C', 'TGA': '*', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'R', 'AGG': 'R', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['TTG', 'CTG', 'ATT', 'ATC', 'ATA', 'ATG', 'GTG'],
 			'stop_codons': ['TAA', 'TGA']
 		},
 		33 : {
-			'name': '',
 			'description': 'Cephalodiscidae Mitochondrial',
-			'table': {'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L', 'TCT': 'S', 'TCC': 'S', 'TCA': 'S', 'TCG': 'S', 'TAT': 'Y', 'TAC': 'Y', 'TAA': 'Y', 'TAG': '*', 'TGT': 'C', 'TGC': 'C', 'TGA': 'W', 'TGG': 'W', 'CTT': 'L', 'CTC': 'L', 'CTA': 'L', 'CTG': 'L', 'CCT': 'P', 'CCC': 'P', 'CCA': 'P', 'CCG': 'P', 'CAT': 'H', 'CAC': 'H', 'CAA': 'Q', 'CAG': 'Q', 'CGT': 'R', 'CGC': 'R', 'CGA': 'R', 'CGG': 'R', 'ATT': 'I', 'ATC': 'I', 'ATA': 'I', 'ATG': 'M', 'ACT': 'T', 'ACC': 'T', 'ACA': 'T', 'ACG': 'T', 'AAT': 'N', 'AAC': 'N', 'AAA': 'K', 'AAG': 'K', 'AGT': 'S', 'AGC': 'S', 'AGA': 'S', 'AGG': 'K', 'GTT': 'V', 'GTC': 'V', 'GTA': 'V', 'GTG': 'V', 'GCT': 'A', 'GCC': 'A', 'GCA': 'A', 'GCG': 'A', 'GAT': 'D', 'GAC': 'D', 'GAA': 'E', 'GAG': 'E', 'GGT': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'},
 			'start_codons': ['TTG', 'CTG', 'ATG', 'GTG'],
 			'stop_codons': ['TAG']
 		}
 }
 
+# 2-bit code of each base in a codon key
+_NT_2BIT = {'A': 0, 'C': 1, 'G': 2, 'T': 3}
+
+# 2-bit code of every byte value; 255 marks anything that is not a definite base (N, R, Y, ...)
+NT_ENCODE = np.full(256, 255, dtype=np.uint8)
+for _bases, _code in (('Aa', 0), ('Cc', 1), ('Gg', 2), ('TtUu', 3)):
+    NT_ENCODE[np.frombuffer(_bases.encode('ascii'), dtype=np.uint8)] = _code
+NT_ENCODE.flags.writeable = False
+del _bases, _code
+
+def _codon_key(codon: str) -> int:
+    """Return the 6-bit key of a codon, (b0 << 4) | (b1 << 2) | b2."""
+    return (_NT_2BIT[codon[0]] << 4) | (_NT_2BIT[codon[1]] << 2) | _NT_2BIT[codon[2]]
+
+# Key of every codon, in the T, C, A, G order of the NCBI listing
+_CODON_KEYS = {codon: _codon_key(codon) for codon in _STANDARD_TABLE}
+
+ALL_CODON_LUT = np.zeros((max(_TABLE_INFO) + 1, 64), dtype=np.uint8)
+ALL_START_LUT = np.zeros((max(_TABLE_INFO) + 1, 64), dtype=bool)
+ALL_STOP_LUT = np.zeros((max(_TABLE_INFO) + 1, 64), dtype=bool)
+
+for _id, _info in _TABLE_INFO.items():
+    for _codon, _amino_acid in {**_STANDARD_TABLE, **OVERRIDES.get(_id, {})}.items():
+        ALL_CODON_LUT[_id, _CODON_KEYS[_codon]] = ord(_amino_acid)
+    ALL_START_LUT[_id, [_CODON_KEYS[_codon] for _codon in _info['start_codons']]] = True
+    ALL_STOP_LUT[_id, [_CODON_KEYS[_codon] for _codon in _info['stop_codons']]] = True
+del _codon, _amino_acid
+
+# Amino acid order of the codon_to_aaidx indices; the standard residues in alphabetical order,
+# then stop and unknown
+AA_ORDER = "ACDEFGHIKLMNPQRSTVWY*X"
+
+_AA_INDEX = np.full(256, AA_ORDER.index('X'), dtype=np.uint8)
+_AA_INDEX[np.frombuffer(AA_ORDER.encode('ascii'), dtype=np.uint8)] = np.arange(len(AA_ORDER))
+ALL_CODON_TO_AAIDX = _AA_INDEX[ALL_CODON_LUT]
+del _AA_INDEX
+
+# Key of the reverse complement of each codon key: the complement of a 2-bit code c is 3 - c and the
+# order of the three bases is reversed
+_KEYS = np.arange(64)
+_RC_KEYS = ((3 - (_KEYS & 3)) << 4) | ((3 - ((_KEYS >> 2) & 3)) << 2) | (3 - (_KEYS >> 4))
+ALL_RC_CODON_LUT = ALL_CODON_LUT[:, _RC_KEYS]
+del _KEYS, _RC_KEYS
+
+# Bit k of a mask is set when codon key k is a start (stop) codon
+_BIT_VALUES = np.uint64(1) << np.arange(64, dtype=np.uint64)
+ALL_START_MASK = np.bitwise_or.reduce(np.where(ALL_START_LUT, _BIT_VALUES, np.uint64(0)), axis=1)
+ALL_STOP_MASK = np.bitwise_or.reduce(np.where(ALL_STOP_LUT, _BIT_VALUES, np.uint64(0)), axis=1)
+del _BIT_VALUES
+
+# Shared by every caller, so the lookup arrays are read-only
+for _lut in (ALL_CODON_LUT, ALL_RC_CODON_LUT, ALL_CODON_TO_AAIDX, ALL_START_LUT, ALL_STOP_LUT, ALL_START_MASK, ALL_STOP_MASK):
+    _lut.flags.writeable = False
+del _lut
+
+class GeneticCode(Mapping):
+    """
+    The lookup arrays and metadata of one genetic code; the arrays are read-only views into the ALL_* matrices.
+
+    The fields are read as attributes, e.g. code.codon_lut, and are all that is pickled. For callers of
+    the former table dicts, a GeneticCode is also a read-only mapping with their keys: 'name',
+    'description', 'start_codons', 'stop_codons' and 'table' (codon -> amino acid), plus the field
+    names. The codon tuples and the 'table' dict are derived from the arrays on first use and cached.
+    """
+    _fields = ('codon_lut', 'rc_codon_lut', 'codon_to_aaidx', 'start_lut', 'stop_lut',
+               'start_mask', 'stop_mask', 'description', 'name')
+    _KEYS = ('name', 'description', 'start_codons', 'stop_codons', 'table') + _fields[:7]
+    __slots__ = _fields + ('_codon_views',)
+
+    def __init__(self, codon_lut: np.ndarray, rc_codon_lut: np.ndarray, codon_to_aaidx: np.ndarray,
+                 start_lut: np.ndarray, stop_lut: np.ndarray, start_mask: np.uint64, stop_mask: np.uint64,
+                 description: str, name: str = ''):
+        values = (codon_lut, rc_codon_lut, codon_to_aaidx, start_lut, stop_lut, start_mask, stop_mask,
+                  description, name)
+        for field, value in zip(self._fields, values):
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, '_codon_views', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"GeneticCode is read-only, cannot set {name!r}")
+
+    def __reduce__(self):
+        return GeneticCode, tuple(getattr(self, field) for field in self._fields)
+
+    def __repr__(self):
+        return f"GeneticCode(description={self.description!r}, name={self.name!r})"
+
+    def _views(self) -> dict:
+        """Build the 'start_codons', 'stop_codons' and 'table' values once, in the T, C, A, G codon order."""
+        if self._codon_views is None:
+            object.__setattr__(self, '_codon_views', {
+                'start_codons': tuple(codon for codon, key in _CODON_KEYS.items() if self.start_lut[key]),
+                'stop_codons': tuple(codon for codon, key in _CODON_KEYS.items() if self.stop_lut[key]),
+                'table': MappingProxyType({codon: chr(self.codon_lut[key]) for codon, key in _CODON_KEYS.items()}),
+            })
+        return self._codon_views
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            return getattr(self, key)
+        if key in ('start_codons', 'stop_codons', 'table'):
+            return self._views()[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+# Read-only, so that no caller can change a genetic code for everyone else
+tables = MappingProxyType({
+    _id: GeneticCode(
+        codon_lut=ALL_CODON_LUT[_id],
+        rc_codon_lut=ALL_RC_CODON_LUT[_id],
+        codon_to_aaidx=ALL_CODON_TO_AAIDX[_id],
+        start_lut=ALL_START_LUT[_id],
+        stop_lut=ALL_STOP_LUT[_id],
+        start_mask=ALL_START_MASK[_id],
+        stop_mask=ALL_STOP_MASK[_id],
+        description=_info['description'],
+        name=_info.get('name', ''),
+    )
+    for _id, _info in _TABLE_INFO.items()
+})
+OVERRIDES = MappingProxyType({_id: MappingProxyType(_codons) for _id, _codons in OVERRIDES.items()})
+del _id, _info
+
+def get_codon_lut(table_id: int) -> np.ndarray:
+    """
+    Return the codon lookup array of a genetic code.
+
+    Args:
+        table_id (int): The NCBI table ID.
+
+    Returns:
+        np.ndarray: A read-only view of the (64,) uint8 row of ALL_CODON_LUT for the table.
+
+    Raises:
+        KeyError: If the table ID is unknown.
+    """
+    if table_id not in tables:
+        raise KeyError(table_id)
+    return ALL_CODON_LUT[table_id]
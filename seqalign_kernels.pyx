@@ -0,0 +1,66 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+# distutils: extra_compile_args = -O3 -march=native -ftree-vectorize
+"""
+Compiled int16 kernels for the dynamic programming fill in SeqAlign.py.
+
+Build in place, together with the C kernels, with:
+    python setup.py build_ext --inplace
+
+SeqAlign.dynamic_programming picks these up automatically when the extension is importable and the
+alignment scores are guaranteed to fit in 16 bits.
+"""
+
+cpdef void fill_nw_int16(const unsigned char[::1] a, const unsigned char[::1] b, const short[:, ::1] sub,
+                         short gap, short[:, ::1] out) noexcept nogil:
+    """
+    Fill `out` with the Needleman-Wunsch score matrix of the encoded sequences `a` and `b`.
+
+    Args:
+        a (uint8 array): The first sequence, encoded as row indices of `sub`.
+        b (uint8 array): The second sequence, encoded as column indices of `sub`.
+        sub (int16 array): The dense substitution matrix.
+        gap (int): The gap penalty.
+        out (int16 array): The (len(a) + 1, len(b) + 1) output score matrix.
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t M = a.shape[0] + 1, N = b.shape[0] + 1
+    cdef short diag, up, left, best
+
+    for j in range(N):
+        out[0, j] = <short>(j * gap)
+    for i in range(M):
+        out[i, 0] = <short>(i * gap)
+
+    for i in range(1, M):
+        for j in range(1, N):
+            diag = out[i-1, j-1] + sub[a[i-1], b[j-1]]
+            up = out[i-1, j] + gap
+            left = out[i, j-1] + gap
+            best = diag if diag > up else up
+            out[i, j] = best if best > left else left
+
+
+cpdef void fill_sw_int16(const unsigned char[::1] a, const unsigned char[::1] b, const short[:, ::1] sub,
+                         short gap, short[:, ::1] out) noexcept nogil:
+    """
+    Fill `out` with the Smith-Waterman score matrix of the encoded sequences `a` and `b`.
+
+    Takes the same arguments as `fill_nw_int16`.
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t M = a.shape[0] + 1, N = b.shape[0] + 1
+    cdef short diag, up, left, best
+
+    for j in range(N):
+        out[0, j] = 0
+    for i in range(M):
+        out[i, 0] = 0
+
+    for i in range(1, M):
+        for j in range(1, N):
+            diag = out[i-1, j-1] + sub[a[i-1], b[j-1]]
+            up = out[i-1, j] + gap
+            left = out[i, j-1] + gap
+            best = diag if diag > up else up
+            best = best if best > left else left
+            out[i, j] = best if best > 0 else 0
@@ -0,0 +1,45 @@
+"""
+Build the optional native kernels next to the modules that load them:
+    python setup.py build_ext --inplace
+
+- seqalign_kernels: the Cython int16 DP fill used by SeqAlign.dynamic_programming (needs Cython).
+- _sw_striped.so: the striped SIMD Smith-Waterman kernels loaded by SeqAlign through ctypes.
+- _seq_simd.so: the SIMD GC-count and Hamming kernels loaded by SeqAnalysis through ctypes.
+
+Every kernel is optional; without them the modules fall back to Numba or NumPy.
+"""
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+# Plain C shared libraries opened with ctypes.CDLL, so they keep their bare '<name>.so' file name
+# and export no Python module init function
+_CTYPES_LIBRARIES = ('_sw_striped', '_seq_simd')
+
+class BuildExt(build_ext):
+    """build_ext that names the ctypes libraries the way SeqAlign and SeqAnalysis look them up."""
+
+    def get_ext_filename(self, fullname):
+        if fullname in _CTYPES_LIBRARIES:
+            return fullname + '.so'
+        return super().get_ext_filename(fullname)
+
+    def get_export_symbols(self, ext):
+        if ext.name in _CTYPES_LIBRARIES:
+            return []
+        return super().get_export_symbols(ext)
+
+ext_modules = [Extension(name, sources=[name + '.c'], extra_compile_args=['-O3']) for name in _CTYPES_LIBRARIES]
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    print("Cython is not installed, skipping seqalign_kernels.")
+else:
+    # The compile flags (-O3 -march=native -ftree-vectorize) come from the header of the .pyx file
+    ext_modules += cythonize('seqalign_kernels.pyx')
+
+setup(
+    name='BioHub',
+    ext_modules=ext_modules,
+    cmdclass={'build_ext': BuildExt},
+)
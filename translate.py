@@ -0,0 +1,65 @@
+"""
+Translation kernels over uint8 arrays, built on the codon lookup arrays of genetic_code.py.
+
+translate_bytes() turns the ASCII codes of a DNA sequence into the ASCII codes of its protein in one
+pass: each base is mapped to its 2-bit code, three codes are packed into the 6-bit codon key and the
+key is looked up in a (64,) codon_lut. Bases are encoded with genetic_code.NT_ENCODE, so either case
+and U for T are accepted; codons with any other symbol, e.g. an IUPAC ambiguity code, become 'X'.
+A Numba kernel is used when Numba is installed, otherwise the same steps run as NumPy gathers.
+"""
+import numpy as np
+from genetic_code import NT_ENCODE, get_codon_lut
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+_UNKNOWN = ord('X')
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _translate_kernel(nt_bytes: np.ndarray, encode: np.ndarray, codon_lut: np.ndarray,
+                          out: np.ndarray) -> None:
+        """Write the amino acid of each complete codon of `nt_bytes` to `out`."""
+        for i in range(out.size):
+            c0 = encode[nt_bytes[3 * i]]
+            c1 = encode[nt_bytes[3 * i + 1]]
+            c2 = encode[nt_bytes[3 * i + 2]]
+            if (c0 | c1 | c2) > 3:
+                out[i] = _UNKNOWN
+            else:
+                out[i] = codon_lut[(c0 << 4) | (c1 << 2) | c2]
+
+def _translate_numpy(nt_bytes: np.ndarray, codon_lut: np.ndarray, out: np.ndarray) -> None:
+    """NumPy version of _translate_kernel."""
+    codes = NT_ENCODE[nt_bytes[:3 * out.size]].reshape(-1, 3)
+    keys = (codes[:, 0] << 4) | (codes[:, 1] << 2) | codes[:, 2]
+    out[:] = np.where((codes > 3).any(axis=1), _UNKNOWN, codon_lut[keys & 63])
+
+def translate_bytes(nt_bytes: np.ndarray, table: int = 1) -> np.ndarray:
+    """
+    Translate the ASCII codes of a DNA sequence into the ASCII codes of the protein.
+
+    Args:
+        nt_bytes (np.ndarray): The uint8 ASCII codes of the sequence. Incomplete trailing bases are ignored.
+        table (int, optional): The NCBI table ID of the genetic code. Defaults to 1.
+
+    Returns:
+        np.ndarray: The uint8 ASCII codes of the amino acids, 'X' for codons with other symbols than A/C/G/T/U.
+
+    Raises:
+        KeyError: If the table ID is unknown.
+    """
+    codon_lut = get_codon_lut(table)
+    out = np.empty(nt_bytes.size // 3, dtype=np.uint8)
+    if _NUMBA_AVAILABLE:
+        _translate_kernel(nt_bytes, NT_ENCODE, codon_lut, out)
+    else:
+        _translate_numpy(nt_bytes, codon_lut, out)
+    return out
+
+# Compile (or load from the on-disk cache) once at import so the first call is not charged for the JIT.
+if _NUMBA_AVAILABLE:
+    translate_bytes(np.frombuffer(b'ATG', dtype=np.uint8))
@@ -1,27 +1,54 @@
 class BASEException(Exception):
-    """Base class for exceptions in this module."""
-    pass
+    """Base class for exceptions in this module.
+
+    Subclasses keep only their raw arguments and a class-level %-style _TEMPLATE; the message is
+    formatted from both by __str__ when the exception is actually displayed, so exceptions that are
+    raised and caught cost no string formatting. Without a template, or with other arguments than the
+    template expects, the message is the builtin one.
+    """
+    _TEMPLATE = None
+
+    def __str__(self):
+        if self._TEMPLATE is None or len(self.args) != self._TEMPLATE.count('%s'):
+            return super().__str__()
+        return self._TEMPLATE % self.args
+
+    @property
+    def message(self):
+        return str(self)
+
+class InputFileNotFoundError(BASEException, FileNotFoundError):
+    """Exception raised for errors in the input file not found.
+
+    Also a subclass of the builtin FileNotFoundError, so `except FileNotFoundError` / `except OSError`
+    handlers catch it as well.
+    """
+    _TEMPLATE = "The file %s does not exist."
 
-class FileNotFoundError(BASEException):
-    """Exception raised for errors in the input file not found."""
     def __init__(self, filepath):
-        self.message = f"The file {filepath} does not exist."
-        super().__init__(self.message)
+        self.filepath = filepath
+        super().__init__(filepath)
 
 class EmptyFileError(BASEException):
     """Exception raised for empty files."""
+    _TEMPLATE = "The file %s is empty."
+
     def __init__(self, filepath):
-        self.message = f"The file {filepath} is empty."
-        super().__init__(self.message)
+        self.filepath = filepath
+        super().__init__(filepath)
 
 class InvalidSequenceError(BASEException):
     """Exception raised for invalid DNA or protein sequences."""
+    _TEMPLATE = "Invalid sequence detected under header %s: %s"
+
     def __init__(self, header, sequence):
-        self.message = f"Invalid sequence detected under header {header}: {sequence}"
-        super().__init__(self.message)
+        self.header, self.sequence = header, sequence
+        super().__init__(header, sequence)
 
 class GeneralFASTAError(BASEException):
     """Exception raised for general errors in this module."""
+    _TEMPLATE = "An error occurred while reading the file %s: %s"
+
     def __init__(self, filepath, error):
-        self.message = f"An error occurred while reading the file {filepath}: {error}"
-        super().__init__(self.message)
\ No newline at end of file
+        self.filepath, self.error = filepath, error
+        super().__init__(filepath, error)